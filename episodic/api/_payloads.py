@@ -0,0 +1,71 @@
+"""Payload shapes and required-field checks for the API request builders.
+
+The field tuples fix the order in which missing keys are reported, and the
+``TypedDict`` shapes let ``episodic.api.helpers`` narrow a validated payload
+with one cast instead of per-key checks.
+"""
+
+import operator
+import typing as typ
+
+from .errors import validation_error
+
+if typ.TYPE_CHECKING:
+    import falcon
+
+    from .types import JsonPayload
+
+# Required payload keys per builder, in the order missing keys are reported.
+_PROFILE_UPDATE_FIELDS = ("title", "configuration")
+_PROFILE_CREATE_FIELDS = ("slug", *_PROFILE_UPDATE_FIELDS)
+_TEMPLATE_UPDATE_FIELDS = ("title", "structure")
+_TEMPLATE_CREATE_FIELDS = ("series_profile_id", "slug", *_TEMPLATE_UPDATE_FIELDS)
+# Create payloads carry the most required keys, so fetch them in one C-level
+# call; the getter raises ``KeyError`` for the first missing key in order.
+_get_profile_create_fields = operator.itemgetter(*_PROFILE_CREATE_FIELDS)
+_get_template_create_fields = operator.itemgetter(*_TEMPLATE_CREATE_FIELDS)
+
+
+class _AuditPayload(typ.TypedDict, total=False):
+    """Optional audit metadata keys accepted by write payloads."""
+
+    actor: str | None
+    note: str | None
+
+
+class _ProfileFieldsPayload(typ.TypedDict):
+    """Series-profile fields carried by create and update payloads."""
+
+    title: str
+    description: typ.NotRequired[str | None]
+    configuration: dict[str, object]
+
+
+class _TemplateFieldsPayload(typ.TypedDict):
+    """Episode-template fields carried by create and update payloads."""
+
+    title: str
+    description: typ.NotRequired[str | None]
+    structure: dict[str, object]
+
+
+def _missing_field_error(field_name: str) -> falcon.HTTPBadRequest:
+    """Build the HTTP 400 raised for a missing required payload field."""
+    msg = f"Missing required field: {field_name}"
+    return validation_error(msg, field=field_name, constraint="required")
+
+
+def _missing_fields_error(
+    payload: JsonPayload,
+    field_names: tuple[str, ...],
+) -> falcon.HTTPBadRequest:
+    """Build one HTTP 400 naming every required key absent from payload.
+
+    Only called after a required lookup has failed, so the scan stays off the
+    success path. The envelope ``field`` detail names the first missing key.
+    """
+    missing = [name for name in field_names if name not in payload]
+    if len(missing) == 1:
+        return _missing_field_error(missing[0])
+    msg = f"Missing required fields: {', '.join(missing)}"
+    return validation_error(msg, field=missing[0], constraint="required")
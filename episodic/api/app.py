@@ -15,10 +15,14 @@ app = create_app(dependencies)  # Returns a Falcon ASGI app with API routes.
 import asyncio
 import typing as typ
 
-from falcon import asgi
+import falcon
+import orjson
+from falcon import asgi, media
+
+from episodic.canonical.profile_templates import EntityNotFoundError
 
 from .authorization import AuthorizationMiddleware
-from .errors import serialize_http_error
+from .errors import handle_entity_not_found, serialize_http_error
 from .resources import (
     EpisodeTemplateHistoryResource,
     EpisodeTemplateResource,
@@ -67,6 +71,13 @@ class _ShutdownHooksMiddleware:
         )
 
 
+def _use_orjson_media(app: asgi.App) -> None:
+    """Parse and render JSON bodies with orjson instead of stdlib ``json``."""
+    json_handler = media.JSONHandler(dumps=orjson.dumps, loads=orjson.loads)
+    app.req_options.media_handlers[falcon.MEDIA_JSON] = json_handler
+    app.resp_options.media_handlers[falcon.MEDIA_JSON] = json_handler
+
+
 def _register_health_routes(app: asgi.App, dependencies: ApiDependencies) -> None:
     app.add_route("/health/live", HealthLiveResource())
     app.add_route(
@@ -172,6 +183,8 @@ def create_app(dependencies: ApiDependencies) -> asgi.App:
             typ.cast("typ.Any", _ShutdownHooksMiddleware(dependencies.shutdown_hooks))
         )
     app.set_error_serializer(serialize_http_error)
+    app.add_error_handler(EntityNotFoundError, handle_entity_not_found)
+    _use_orjson_media(app)
 
     uow_factory = dependencies.uow_factory
 
@@ -248,6 +248,21 @@ def map_profile_template_error(
             )
 
 
+async def handle_entity_not_found(  # noqa: RUF029  # Falcon ASGI requires error handlers to be coroutines
+    req: falcon.Request,
+    resp: falcon.Response,
+    ex: EntityNotFoundError,
+    params: dict[str, typ.Any],
+) -> typ.NoReturn:
+    """Translate uncaught profile/template lookups into a plain 404.
+
+    Registered once on the app so read-only resources need no ``try`` block
+    of their own; handlers that add identifier details still catch locally.
+    """
+    del req, resp, params
+    raise falcon.HTTPNotFound(description=str(ex)) from ex
+
+
 def map_reference_error(
     exc: ReferenceDocumentError,
     *,
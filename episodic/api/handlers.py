@@ -3,30 +3,33 @@
 The module provides reusable request/response helpers for resource adapters:
 ``handle_get_entity``, ``handle_get_history``, and ``handle_update_entity``.
 Resources should import these handlers when they need consistent UUID parsing,
-service dispatch, and Falcon HTTP error translation.
+service dispatch, and Falcon HTTP error translation. ``write_json_with_etag``
+applies the same ``If-None-Match`` check to pre-serialized JSON bodies.
 
 Examples
 --------
->>> media, status = await handle_get_entity(
+>>> media, status, etag = await handle_get_entity(
 ...     factory, profile_id, "profile_id", service_fn, serializer_fn
 ... )
->>> media, status = await handle_get_history(
+>>> media, status, etag = await handle_get_history(
 ...     factory, profile_id, "profile_id", history_fn, serializer_fn
 ... )
 """
 
 import dataclasses as dc
+import hashlib
 import typing as typ
 
 import falcon
+import orjson
 
 from episodic.canonical.profile_templates import (
     EntityNotFoundError,
     RevisionConflictError,
 )
 
-from .errors import map_profile_template_error, validation_error
-from .helpers import parse_uuid
+from .errors import map_profile_template_error
+from .helpers import parse_uuid, require_payload_fields
 
 if typ.TYPE_CHECKING:
     import collections.abc as cabc
@@ -41,15 +44,48 @@ if typ.TYPE_CHECKING:
     from .types import JsonPayload, UowFactory
 
 
+def _etag_matches(etag: str, if_none_match: cabc.Collection[str] | None) -> bool:
+    """Return whether an ``If-None-Match`` tag list already names ``etag``."""
+    return if_none_match is not None and (etag in if_none_match or "*" in if_none_match)
+
+
+def write_json_with_etag(
+    req: falcon.Request,
+    resp: falcon.Response,
+    payload: JsonPayload,
+) -> None:
+    """Write a JSON body tagged with an ETag derived from its bytes.
+
+    Requests whose ``If-None-Match`` header already names the tag receive
+    ``304 Not Modified`` without a body, so polling clients skip downloading
+    and parsing collections that have not changed.
+    """
+    body = orjson.dumps(payload)
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    resp.etag = etag
+    resp.content_type = falcon.MEDIA_JSON
+    if _etag_matches(etag, req.if_none_match):
+        resp.status = falcon.HTTP_304
+        return
+    resp.data = body
+    resp.status = falcon.HTTP_200
+
+
 async def handle_get_entity[EntityT](  # noqa: PLR0913, PLR0917  # TODO(@episodic-dev): https://github.com/leynos/episodic/issues/1234 explicit shared handler signature for resource adapters
     uow_factory: UowFactory,
     entity_id: str,
     id_field_name: str,
     service_fn: cabc.Callable[..., cabc.Awaitable[tuple[EntityT, int]]],
     serializer_fn: cabc.Callable[[EntityT, int], JsonPayload],
-) -> tuple[JsonPayload, str]:
+    *,
+    if_none_match: cabc.Collection[str] | None = None,
+) -> tuple[JsonPayload | None, str, str]:
     """Handle fetch-by-identifier endpoint behaviour.
 
+    The entity revision doubles as the response ETag. When ``if_none_match``
+    already names that revision, the serializer is skipped and the handler
+    reports ``304 Not Modified`` without a payload.
+
     Parameters
     ----------
     uow_factory : UowFactory
@@ -62,11 +98,14 @@ async def handle_get_entity[EntityT](  # noqa: PLR0913, PLR0917  # TODO(@episodi
         Service function that returns an entity and its revision.
     serializer_fn : cabc.Callable[[EntityT, int], JsonPayload]
         Serializer that converts the entity payload to response JSON.
+    if_none_match : cabc.Collection[str] | None, optional
+        Entity tags from the request ``If-None-Match`` header, if any.
 
     Returns
     -------
-    tuple[JsonPayload, str]
-        Serialized response payload and HTTP status code.
+    tuple[JsonPayload | None, str, str]
+        Serialized response payload (``None`` when not modified), HTTP
+        status code, and entity tag.
 
     Raises
     ------
@@ -84,7 +123,10 @@ async def handle_get_entity[EntityT](  # noqa: PLR0913, PLR0917  # TODO(@episodi
             )
     except EntityNotFoundError as exc:
         raise map_profile_template_error(exc, entity_id=parsed_entity_id) from exc
-    return serializer_fn(entity, revision), falcon.HTTP_200
+    etag = str(revision)
+    if _etag_matches(etag, if_none_match):
+        return None, falcon.HTTP_304, etag
+    return serializer_fn(entity, revision), falcon.HTTP_200, etag
 
 
 @dc.dataclass(frozen=True, slots=True)
@@ -93,7 +135,8 @@ class HistoryRequest[EntityT]:
 
     Bundling these fields keeps the public handler signature small while
     preserving the shared-base resource pattern that the canonical history
-    resources rely on.
+    resources rely on. ``count_fn`` and ``if_none_match`` are optional; when
+    both are set, an unchanged history is answered without loading a page.
     """
 
     entity_id: str
@@ -101,14 +144,20 @@ class HistoryRequest[EntityT]:
     service_fn: cabc.Callable[..., cabc.Awaitable[tuple[list[EntityT], int]]]
     serializer_fn: cabc.Callable[[EntityT], JsonPayload]
     page: Pagination
+    count_fn: cabc.Callable[..., cabc.Awaitable[int]] | None = None
+    if_none_match: cabc.Collection[str] | None = None
 
 
 async def handle_get_history[EntityT](
     uow_factory: UowFactory,
     request: HistoryRequest[EntityT],
-) -> tuple[JsonPayload, str]:
+) -> tuple[JsonPayload | None, str, str]:
     """Handle history-list endpoint behaviour.
 
+    History is append-only, so the entry count serves as the ETag for every
+    page of it. When the request already holds that tag, only the count is
+    queried and the handler reports ``304 Not Modified`` without a payload.
+
     Parameters
     ----------
     uow_factory : UowFactory
@@ -119,8 +168,9 @@ async def handle_get_history[EntityT](
 
     Returns
     -------
-    tuple[JsonPayload, str]
-        JSON object containing serialized ``items`` and HTTP status code.
+    tuple[JsonPayload | None, str, str]
+        JSON object containing serialized ``items`` (``None`` when not
+        modified), HTTP status code, and entity tag.
 
     Raises
     ------
@@ -130,8 +180,13 @@ async def handle_get_history[EntityT](
         Raised when the parent entity is not found.
     """
     parsed_entity_id = parse_uuid(request.entity_id, request.id_field_name)
+    if_none_match = request.if_none_match
     try:
         async with uow_factory() as uow:
+            if if_none_match is not None and request.count_fn is not None:
+                etag = str(await request.count_fn(uow, parent_id=parsed_entity_id))
+                if _etag_matches(etag, if_none_match):
+                    return None, falcon.HTTP_304, etag
             items, total = await request.service_fn(
                 uow,
                 parent_id=parsed_entity_id,
@@ -147,19 +202,10 @@ async def handle_get_history[EntityT](
             "total": total,
         },
         falcon.HTTP_200,
+        str(total),
     )
 
 
-def _require_payload_fields(
-    payload: JsonPayload, required_fields: cabc.Sequence[str]
-) -> None:
-    """Raise ``validation_error`` for the first missing required payload field."""
-    for field_name in required_fields:
-        if field_name not in payload:
-            msg = f"Missing required field: {field_name}"
-            raise validation_error(msg, field=field_name, constraint="required")
-
-
 def _raise_mapped_update_error(
     exc: EntityNotFoundError | RevisionConflictError,
     *,
@@ -234,7 +280,7 @@ async def handle_update_entity[EntityT](  # noqa: PLR0913, PLR0917  # TODO(@epis
         Raised when optimistic-lock revision preconditions fail.
     """
     parsed_entity_id = parse_uuid(entity_id, id_field_name)
-    _require_payload_fields(payload, required_fields)
+    require_payload_fields(payload, required_fields)
     update_request = request_builder(parsed_entity_id, payload)
     try:
         async with uow_factory() as uow:
@@ -286,11 +332,7 @@ async def handle_create_entity[EntityT](  # noqa: PLR0913  # TODO(@episodic-dev)
     falcon.HTTPNotFound
         Raised when create preconditions reference unknown entities.
     """
-    for field_name in required_fields:
-        if field_name not in payload:
-            msg = f"Missing required field: {field_name}"
-            raise validation_error(msg, field=field_name, constraint="required")
-
+    require_payload_fields(payload, required_fields)
     service_kwargs = kwargs_builder(payload)
     try:
         async with uow_factory() as uow:
@@ -17,9 +17,8 @@ Build a typed update request from JSON payload:
 """
 
 import copy
-import dataclasses as dc
 import enum
-import re
+import reprlib
 import typing as typ
 import uuid
 
@@ -34,18 +33,32 @@ from episodic.canonical.profile_templates import (
     UpdateSeriesProfileRequest,
 )
 
+from ._payloads import (
+    _PROFILE_CREATE_FIELDS,
+    _PROFILE_UPDATE_FIELDS,
+    _TEMPLATE_CREATE_FIELDS,
+    _TEMPLATE_UPDATE_FIELDS,
+    _get_profile_create_fields,
+    _get_template_create_fields,
+    _missing_field_error,
+    _missing_fields_error,
+)
 from .errors import validation_error
 
 if typ.TYPE_CHECKING:
-    import collections.abc as cabc
-
     import falcon
 
+    from ._payloads import _AuditPayload, _ProfileFieldsPayload, _TemplateFieldsPayload
     from .types import JsonPayload
 
-_INT_RE = re.compile(r"[+-]?\d+")
 _DEFAULT_PAGE_LIMIT = 20
 _MAX_PAGE_LIMIT = 100
+_OBJECT_PAYLOAD_REQUIRED_MSG = "JSON object payload is required."
+# Bound how much of a rejected value is echoed back so oversized garbage
+# input cannot inflate error formatting and response bodies.
+_ERROR_VALUE_REPR = reprlib.Repr(maxstring=80)
+# ``AuditMetadata`` is frozen, so anonymous writes can share one instance.
+_EMPTY_AUDIT = AuditMetadata(actor=None, note=None)
 
 
 def parse_uuid(raw_value: str, field_name: str) -> uuid.UUID:
@@ -71,8 +84,13 @@ def parse_uuid(raw_value: str, field_name: str) -> uuid.UUID:
     try:
         return uuid.UUID(raw_value)
     except (TypeError, ValueError, AttributeError) as exc:
-        msg = f"Invalid UUID for {field_name}: {raw_value!r}."
-        raise validation_error(msg, field=field_name, constraint="uuid") from exc
+        raise _invalid_uuid_error(raw_value, field_name) from exc
+
+
+def _invalid_uuid_error(raw_value: object, field_name: str) -> falcon.HTTPBadRequest:
+    """Build the HTTP 400 raised for an unparseable UUID field."""
+    msg = f"Invalid UUID for {field_name}: {_ERROR_VALUE_REPR.repr(raw_value)}."
+    return validation_error(msg, field=field_name, constraint="uuid")
 
 
 def require_payload_dict(payload: object) -> JsonPayload:
@@ -94,8 +112,7 @@ def require_payload_dict(payload: object) -> JsonPayload:
         Raised when request media is not a JSON object.
     """
     if not isinstance(payload, dict):
-        msg = "JSON object payload is required."
-        raise validation_error(msg, constraint="object")
+        raise validation_error(_OBJECT_PAYLOAD_REQUIRED_MSG, constraint="object")
     return typ.cast("JsonPayload", payload)
 
 
@@ -191,10 +208,12 @@ def build_audit_metadata(payload: JsonPayload) -> AuditMetadata:
     AuditMetadata
         Audit metadata value object for service-layer calls.
     """
-    return AuditMetadata(
-        actor=typ.cast("str | None", payload.get("actor")),
-        note=typ.cast("str | None", payload.get("note")),
-    )
+    get_audit_field = typ.cast("_AuditPayload", payload).get
+    actor = get_audit_field("actor")
+    note = get_audit_field("note")
+    if actor is None and note is None:
+        return _EMPTY_AUDIT
+    return AuditMetadata(actor=actor, note=note)
 
 
 def parse_expected_revision(payload: JsonPayload) -> int:
@@ -216,7 +235,14 @@ def parse_expected_revision(payload: JsonPayload) -> int:
         Raised when ``expected_revision`` is missing, not an integer, or not
         strictly positive.
     """
-    raw = _require_field(payload, "expected_revision")
+    try:
+        raw = payload["expected_revision"]
+    except KeyError as exc:
+        raise _missing_field_error("expected_revision") from exc
+    # JSON numbers arrive as exact ``int`` values; ``bool`` fails the exact
+    # type check and falls through to the strict coercion below.
+    if type(raw) is int and raw > 0:
+        return raw
     parsed = _coerce_strict_positive_int(raw)
     if parsed is not None:
         return parsed
@@ -228,12 +254,24 @@ def parse_expected_revision(payload: JsonPayload) -> int:
     )
 
 
-def _require_field(payload: JsonPayload, field_name: str) -> object:
-    """Return a required payload field or raise HTTP 400."""
-    if field_name not in payload:
-        msg = f"Missing required field: {field_name}"
-        raise validation_error(msg, field=field_name, constraint="required")
-    return payload[field_name]
+def require_payload_fields(payload: JsonPayload, field_names: tuple[str, ...]) -> None:
+    """Validate that every required key is present in a JSON payload.
+
+    Parameters
+    ----------
+    payload : JsonPayload
+        Parsed request payload.
+    field_names : tuple[str, ...]
+        Required keys, in the order missing keys are reported.
+
+    Raises
+    ------
+    falcon.HTTPBadRequest
+        Raised naming every missing key when any required key is absent.
+    """
+    for field_name in field_names:
+        if field_name not in payload:
+            raise _missing_fields_error(payload, field_names)
 
 
 def _coerce_strict_positive_int(value: object) -> int | None:
@@ -244,35 +282,20 @@ def _coerce_strict_positive_int(value: object) -> int | None:
         return value if value > 0 else None
     if isinstance(value, str):
         stripped_value = value.strip()
-        if _INT_RE.fullmatch(stripped_value) is None:
+        digits = (
+            stripped_value[1:]
+            if stripped_value.startswith(("+", "-"))
+            else stripped_value
+        )
+        # ``isdecimal`` matches exactly the characters ``\d`` accepts and,
+        # unlike ``int()``, rejects underscore digit separators.
+        if not digits.isdecimal():
             return None
         parsed = int(stripped_value)
         return parsed if parsed > 0 else None
     return None
 
 
-@dc.dataclass(frozen=True, slots=True)
-class _ParsedUpdatePayload[DataT]:
-    """Typed parsed components used to build update request objects."""
-
-    expected_revision: int
-    data: DataT
-    audit: AuditMetadata
-
-
-def _build_update_kwargs[DataT](
-    payload: JsonPayload,
-    *,
-    data_builder: cabc.Callable[[JsonPayload], DataT],
-) -> _ParsedUpdatePayload[DataT]:
-    """Build generic update kwargs with optimistic-lock fields."""
-    return _ParsedUpdatePayload(
-        expected_revision=parse_expected_revision(payload),
-        data=data_builder(payload),
-        audit=build_audit_metadata(payload),
-    )
-
-
 def _build_payload_dataclass[DataT](
     payload: JsonPayload,
     *,
@@ -282,12 +305,13 @@ def _build_payload_dataclass[DataT](
     """Construct a dataclass from mapped payload fields."""
     values: dict[str, object] = {}
     for field_name, (payload_key, is_optional) in field_map.items():
-        raw = (
-            payload.get(payload_key)
-            if is_optional
-            else _require_field(payload, payload_key)
-        )
-        values[field_name] = raw
+        if is_optional:
+            values[field_name] = payload.get(payload_key)
+            continue
+        try:
+            values[field_name] = payload[payload_key]
+        except KeyError as exc:
+            raise _missing_field_error(payload_key) from exc
     return dc_type(**values)
 
 
@@ -302,18 +326,21 @@ def _optional_json_object_field(
     if not isinstance(value, dict):
         msg = f"{field_name} must be a JSON object."
         raise validation_error(msg, field=field_name, constraint="object")
-    return typ.cast("dict[str, object]", copy.deepcopy(value))
+    return copy.deepcopy(value)
 
 
 def _build_profile_data(payload: JsonPayload) -> SeriesProfileUpdateFields:
     """Build ``SeriesProfileUpdateFields`` from payload fields."""
+    fields = typ.cast("_ProfileFieldsPayload", payload)
+    try:
+        title = fields["title"]
+        configuration = fields["configuration"]
+    except KeyError as exc:
+        raise _missing_fields_error(payload, _PROFILE_UPDATE_FIELDS) from exc
     return SeriesProfileUpdateFields(
-        title=typ.cast("str", _require_field(payload, "title")),
-        description=typ.cast("str | None", payload.get("description")),
-        configuration=typ.cast(
-            "dict[str, object]",
-            _require_field(payload, "configuration"),
-        ),
+        title=title,
+        description=fields.get("description"),
+        configuration=configuration,
         guardrails=_optional_json_object_field(payload, "guardrails") or {},
     )
 
@@ -322,37 +349,20 @@ def _build_template_fields(
     payload: JsonPayload,
 ) -> EpisodeTemplateUpdateFields:
     """Build ``EpisodeTemplateUpdateFields`` from payload fields."""
+    fields = typ.cast("_TemplateFieldsPayload", payload)
+    try:
+        title = fields["title"]
+        structure = fields["structure"]
+    except KeyError as exc:
+        raise _missing_fields_error(payload, _TEMPLATE_UPDATE_FIELDS) from exc
     return EpisodeTemplateUpdateFields(
-        title=typ.cast("str", _require_field(payload, "title")),
-        description=typ.cast("str | None", payload.get("description")),
-        structure=typ.cast(
-            "dict[str, object]",
-            _require_field(payload, "structure"),
-        ),
+        title=title,
+        description=fields.get("description"),
+        structure=structure,
         guardrails=_optional_json_object_field(payload, "guardrails") or {},
     )
 
 
-def _build_typed_update_request[DataT, RequestT](
-    entity_id: uuid.UUID,
-    payload: JsonPayload,
-    *,
-    data_builder: cabc.Callable[[JsonPayload], DataT],
-    request_builder: cabc.Callable[
-        [uuid.UUID, int, DataT, AuditMetadata],
-        RequestT,
-    ],
-) -> RequestT:
-    """Build a typed update request from common payload parsing."""
-    update_kwargs = _build_update_kwargs(payload, data_builder=data_builder)
-    return request_builder(
-        entity_id,
-        update_kwargs.expected_revision,
-        update_kwargs.data,
-        update_kwargs.audit,
-    )
-
-
 def build_profile_create_kwargs(payload: JsonPayload) -> dict[str, object]:
     """Build service kwargs for creating a series profile.
 
@@ -372,14 +382,15 @@ def build_profile_create_kwargs(payload: JsonPayload) -> dict[str, object]:
     falcon.HTTPBadRequest
         Raised when required profile fields are missing.
     """
-    slug = _require_field(payload, "slug")
-    title = _require_field(payload, "title")
-    configuration = _require_field(payload, "configuration")
+    try:
+        slug, title, configuration = _get_profile_create_fields(payload)
+    except KeyError as exc:
+        raise _missing_fields_error(payload, _PROFILE_CREATE_FIELDS) from exc
     data = SeriesProfileCreateData(
-        slug=typ.cast("str", slug),
-        title=typ.cast("str", title),
-        description=typ.cast("str | None", payload.get("description")),
-        configuration=typ.cast("dict[str, object]", configuration),
+        slug=slug,
+        title=title,
+        description=typ.cast("_ProfileFieldsPayload", payload).get("description"),
+        configuration=configuration,
         guardrails=_optional_json_object_field(payload, "guardrails") or {},
     )
     return {
@@ -407,24 +418,23 @@ def build_template_create_kwargs(payload: JsonPayload) -> dict[str, object]:
     falcon.HTTPBadRequest
         Raised when required template fields are missing or invalid.
     """
-    raw_series_profile_id = _require_field(payload, "series_profile_id")
-    slug = _require_field(payload, "slug")
-    title = _require_field(payload, "title")
-    structure = _require_field(payload, "structure")
+    try:
+        raw_series_profile_id, slug, title, structure = _get_template_create_fields(
+            payload
+        )
+    except KeyError as exc:
+        raise _missing_fields_error(payload, _TEMPLATE_CREATE_FIELDS) from exc
 
     audit = build_audit_metadata(payload)
     data = EpisodeTemplateData(
-        slug=typ.cast("str", slug),
-        title=typ.cast("str", title),
-        description=typ.cast("str | None", payload.get("description")),
-        structure=typ.cast("dict[str, object]", structure),
+        slug=slug,
+        title=title,
+        description=typ.cast("_TemplateFieldsPayload", payload).get("description"),
+        structure=structure,
         guardrails=_optional_json_object_field(payload, "guardrails") or {},
     )
     return {
-        "series_profile_id": parse_uuid(
-            typ.cast("str", raw_series_profile_id),
-            "series_profile_id",
-        ),
+        "series_profile_id": parse_uuid(raw_series_profile_id, "series_profile_id"),
         "data": data,
         "audit": audit,
     }
@@ -454,16 +464,11 @@ def build_profile_update_request(
     falcon.HTTPBadRequest
         Raised when required revision or profile fields are missing/invalid.
     """
-    return _build_typed_update_request(
-        entity_id,
-        payload,
-        data_builder=_build_profile_data,
-        request_builder=lambda eid, rev, data, audit: UpdateSeriesProfileRequest(
-            profile_id=eid,
-            expected_revision=rev,
-            data=typ.cast("SeriesProfileUpdateFields", data),
-            audit=audit,
-        ),
+    return UpdateSeriesProfileRequest(
+        profile_id=entity_id,
+        expected_revision=parse_expected_revision(payload),
+        data=_build_profile_data(payload),
+        audit=build_audit_metadata(payload),
     )
 
 
@@ -491,14 +496,9 @@ def build_template_update_request(
     falcon.HTTPBadRequest
         Raised when required revision or template fields are missing/invalid.
     """
-    return _build_typed_update_request(
-        entity_id,
-        payload,
-        data_builder=_build_template_fields,
-        request_builder=lambda eid, rev, fields, audit: UpdateEpisodeTemplateRequest(
-            template_id=eid,
-            expected_revision=rev,
-            data=typ.cast("EpisodeTemplateUpdateFields", fields),
-            audit=audit,
-        ),
+    return UpdateEpisodeTemplateRequest(
+        template_id=entity_id,
+        expected_revision=parse_expected_revision(payload),
+        data=_build_template_fields(payload),
+        audit=build_audit_metadata(payload),
     )
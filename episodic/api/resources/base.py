@@ -2,19 +2,22 @@
 
 This module provides abstract resource mixins that standardize common GET,
 history-list, create, and update endpoint behaviour across concrete adapters.
-Subclasses provide identifier extraction, service functions, and serializers,
-while the base classes handle payload validation and shared handler dispatch.
+Subclasses bind their identifier field, service functions, and serializers as
+class attributes, while the base classes handle payload validation and shared
+handler dispatch.
 
 Examples
 --------
->>> class MyEntityResource(_GetResourceBase): ...
+>>> class MyEntityResource(_GetResourceBase):
+...     _id_field_name = "entity_id"
+...     _service_fn = get_entity
+...     _serializer_fn = serialize_entity
 >>> resource = MyEntityResource(uow_factory)  # Handles GET via shared handler.
 """
 
 import collections.abc as cabc
 import typing as typ
 import uuid
-from abc import ABC, abstractmethod
 
 from episodic.api.handlers import (
     HistoryRequest,
@@ -42,48 +45,56 @@ type UpdateRequestBuilder = cabc.Callable[
     [uuid.UUID, JsonPayload],
     UpdateSeriesProfileRequest | UpdateEpisodeTemplateRequest,
 ]
+type EntityServiceFn = cabc.Callable[..., cabc.Awaitable[tuple[object, int]]]
+type EntitySerializerFn = cabc.Callable[[object, int], JsonPayload]
 
 
-class _ResourceBase(ABC):
-    """Shared base resource that stores the unit-of-work factory."""
+class _ResourceBase:
+    """Shared base resource that stores the unit-of-work factory.
 
-    def __init__(self, uow_factory: UowFactory) -> None:
-        self._uow_factory = uow_factory
+    Subclasses bind their per-entity hooks as class attributes so requests
+    read constants instead of calling accessor methods. Handlers read the
+    hooks through ``type(self)`` because plain functions stored on a class
+    would otherwise bind ``self`` as their first argument. The bases and
+    their subclasses declare ``__slots__`` so instances carry only the
+    factory slot and no per-instance ``__dict__``. Each base lists its hooks
+    in ``_hook_names`` and ``__init_subclass__`` checks them once, at class
+    creation, for every public subclass.
+    """
 
-    @staticmethod
-    @abstractmethod
-    def _resource_base_marker() -> None:
-        """Marker hook to keep the base mixin abstract."""
+    __slots__ = ("_uow_factory",)
 
+    _hook_names: typ.ClassVar[tuple[str, ...]] = ()
 
-class _GetResourceBase[EntityT: object](_ResourceBase, ABC):
-    """Base resource for fetch-by-id endpoints."""
-
-    @staticmethod
-    @typ.override
-    def _resource_base_marker() -> None:
-        """Concrete marker implementation inherited by get resources."""
-        pass
+    def __init__(self, uow_factory: UowFactory) -> None:
+        self._uow_factory = uow_factory
 
-    @staticmethod
-    @abstractmethod
-    def _get_entity_id_from_path(**kwargs: str) -> str:
-        """Return the path parameter value used as the entity identifier."""
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Reject concrete resources that leave a base-class hook unbound."""
+        super().__init_subclass__(**kwargs)
+        if cls.__name__.startswith("_"):
+            return
+        missing = sorted({
+            name
+            for base in cls.__mro__
+            for name in vars(base).get("_hook_names", ())
+            if not hasattr(cls, name)
+        })
+        if missing:
+            msg = f"{cls.__name__} must define class attributes: {', '.join(missing)}."
+            raise TypeError(msg)
+
+
+class _GetResourceBase(_ResourceBase):
+    """Base resource for fetch-by-id endpoints."""
 
-    @staticmethod
-    @abstractmethod
-    def _get_id_field_name() -> str:
-        """Return the service argument name for the entity identifier."""
+    __slots__ = ()
 
-    @staticmethod
-    @abstractmethod
-    def _get_service_fn() -> cabc.Callable[..., cabc.Awaitable[tuple[EntityT, int]]]:
-        """Return the fetch service function for the resource."""
+    _hook_names = ("_id_field_name", "_service_fn", "_serializer_fn")
 
-    @staticmethod
-    @abstractmethod
-    def _get_serializer_fn() -> cabc.Callable[[EntityT, int], JsonPayload]:
-        """Return the response serializer for the resource."""
+    _id_field_name: typ.ClassVar[str]
+    _service_fn: typ.ClassVar[EntityServiceFn]
+    _serializer_fn: typ.ClassVar[EntitySerializerFn]
 
     async def on_get(
         self,
@@ -91,48 +102,38 @@ class _GetResourceBase[EntityT: object](_ResourceBase, ABC):
         resp: falcon.Response,
         **kwargs: str,
     ) -> None:
-        """Fetch one entity by identifier."""
-        del req
-        resp.media, resp.status = await handle_get_entity(
+        """Fetch one entity by identifier, honouring ``If-None-Match``."""
+        cls = type(self)
+        media, resp.status, resp.etag = await handle_get_entity(
             uow_factory=self._uow_factory,
-            entity_id=self._get_entity_id_from_path(**kwargs),
-            id_field_name=self._get_id_field_name(),
-            service_fn=self._get_service_fn(),
-            serializer_fn=self._get_serializer_fn(),
+            entity_id=kwargs[cls._id_field_name],
+            id_field_name=cls._id_field_name,
+            service_fn=cls._service_fn,
+            serializer_fn=cls._serializer_fn,
+            if_none_match=req.if_none_match,
         )
+        if media is not None:
+            resp.media = media
 
 
-class _GetHistoryResourceBase[HistoryT: object](_ResourceBase, ABC):
+class _GetHistoryResourceBase(_ResourceBase):
     """Base resource for history-list endpoints."""
 
-    @staticmethod
-    @typ.override
-    def _resource_base_marker() -> None:
-        """Concrete marker implementation inherited by history resources."""
-        pass
-
-    @staticmethod
-    @abstractmethod
-    def _get_entity_id_from_path(**kwargs: str) -> str:
-        """Return the path parameter value used as the entity identifier."""
-
-    @staticmethod
-    @abstractmethod
-    def _get_id_field_name() -> str:
-        """Return the service argument name for the entity identifier."""
-
-    @staticmethod
-    @abstractmethod
-    def _get_service_fn() -> cabc.Callable[
-        ...,
-        cabc.Awaitable[tuple[list[HistoryT], int]],
-    ]:
-        """Return the history-list service function for the resource."""
-
-    @staticmethod
-    @abstractmethod
-    def _get_serializer_fn() -> cabc.Callable[[HistoryT], JsonPayload]:
-        """Return the item serializer for the resource."""
+    __slots__ = ()
+
+    _hook_names = (
+        "_id_field_name",
+        "_service_fn",
+        "_serializer_fn",
+        "_count_fn",
+    )
+
+    _id_field_name: typ.ClassVar[str]
+    _service_fn: typ.ClassVar[
+        cabc.Callable[..., cabc.Awaitable[tuple[list[object], int]]]
+    ]
+    _serializer_fn: typ.ClassVar[cabc.Callable[[object], JsonPayload]]
+    _count_fn: typ.ClassVar[cabc.Callable[..., cabc.Awaitable[int]]]
 
     async def on_get(
         self,
@@ -140,47 +141,40 @@ class _GetHistoryResourceBase[HistoryT: object](_ResourceBase, ABC):
         resp: falcon.Response,
         **kwargs: str,
     ) -> None:
-        """List history entries for one entity."""
-        resp.media, resp.status = await handle_get_history(
+        """List history entries for one entity, honouring ``If-None-Match``."""
+        cls = type(self)
+        media, resp.status, resp.etag = await handle_get_history(
             self._uow_factory,
             HistoryRequest(
-                entity_id=self._get_entity_id_from_path(**kwargs),
-                id_field_name=self._get_id_field_name(),
-                service_fn=self._get_service_fn(),
-                serializer_fn=self._get_serializer_fn(),
+                entity_id=kwargs[cls._id_field_name],
+                id_field_name=cls._id_field_name,
+                service_fn=cls._service_fn,
+                serializer_fn=cls._serializer_fn,
                 page=parse_pagination(req),
+                count_fn=cls._count_fn,
+                if_none_match=req.if_none_match,
             ),
         )
+        if media is not None:
+            resp.media = media
 
 
-class _CreateResourceBase[EntityT: object](_ResourceBase, ABC):
+class _CreateResourceBase(_ResourceBase):
     """Base resource for create endpoints."""
 
-    @staticmethod
-    @typ.override
-    def _resource_base_marker() -> None:
-        """Concrete marker implementation inherited by create resources."""
-        pass
-
-    @staticmethod
-    @abstractmethod
-    def _get_required_fields() -> tuple[str, ...]:
-        """Return required payload fields for create operations."""
+    __slots__ = ()
 
-    @staticmethod
-    @abstractmethod
-    def _get_kwargs_builder() -> cabc.Callable[[JsonPayload], dict[str, object]]:
-        """Return payload-to-service-kwargs builder."""
+    _hook_names = (
+        "_required_fields",
+        "_kwargs_builder",
+        "_service_fn",
+        "_serializer_fn",
+    )
 
-    @staticmethod
-    @abstractmethod
-    def _get_service_fn() -> cabc.Callable[..., cabc.Awaitable[tuple[EntityT, int]]]:
-        """Return the create service function for the resource."""
-
-    @staticmethod
-    @abstractmethod
-    def _get_serializer_fn() -> cabc.Callable[[EntityT, int], JsonPayload]:
-        """Return the response serializer for the resource."""
+    _required_fields: typ.ClassVar[tuple[str, ...]]
+    _kwargs_builder: typ.ClassVar[cabc.Callable[[JsonPayload], dict[str, object]]]
+    _service_fn: typ.ClassVar[EntityServiceFn]
+    _serializer_fn: typ.ClassVar[EntitySerializerFn]
 
     async def on_post(
         self,
@@ -191,60 +185,38 @@ class _CreateResourceBase[EntityT: object](_ResourceBase, ABC):
         """Create a new entity for a collection endpoint.
 
         Path params are currently unsupported for create routes. Extend
-        ``_get_kwargs_builder`` if nested create routes are introduced.
+        ``_kwargs_builder`` if nested create routes are introduced.
         """
         del kwargs
+        cls = type(self)
         payload = require_payload_dict(await req.get_media())
         resp.media, resp.status = await handle_create_entity(
             uow_factory=self._uow_factory,
             payload=payload,
-            required_fields=self._get_required_fields(),
-            kwargs_builder=self._get_kwargs_builder(),
-            service_fn=self._get_service_fn(),
-            serializer_fn=self._get_serializer_fn(),
+            required_fields=cls._required_fields,
+            kwargs_builder=cls._kwargs_builder,
+            service_fn=cls._service_fn,
+            serializer_fn=cls._serializer_fn,
         )
 
 
-class _UpdateResourceBase[EntityT: object](_ResourceBase, ABC):
+class _UpdateResourceBase(_ResourceBase):
     """Base resource for update-by-id endpoints."""
 
-    @staticmethod
-    @typ.override
-    def _resource_base_marker() -> None:
-        """Concrete marker implementation inherited by update resources."""
-        pass
-
-    @staticmethod
-    @abstractmethod
-    def _get_entity_id_from_path(**kwargs: str) -> str:
-        """Return the path parameter value used as the entity identifier."""
-
-    @staticmethod
-    @abstractmethod
-    def _get_id_field_name() -> str:
-        """Return the service argument name for the entity identifier."""
-
-    @staticmethod
-    @abstractmethod
-    def _get_request_builder() -> UpdateRequestBuilder:
-        """Return the payload-to-request-object builder."""
-
-    @staticmethod
-    @abstractmethod
-    def _get_update_service_fn() -> cabc.Callable[
-        ..., cabc.Awaitable[tuple[EntityT, int]]
-    ]:
-        """Return the update service function for the resource."""
-
-    @staticmethod
-    @abstractmethod
-    def _get_update_serializer_fn() -> cabc.Callable[[EntityT, int], JsonPayload]:
-        """Return the response serializer for the resource."""
-
-    @staticmethod
-    def _get_required_fields() -> tuple[str, ...]:
-        """Return required payload fields for update operations."""
-        return ("expected_revision",)
+    __slots__ = ()
+
+    _hook_names = (
+        "_id_field_name",
+        "_request_builder",
+        "_update_service_fn",
+        "_update_serializer_fn",
+    )
+
+    _id_field_name: typ.ClassVar[str]
+    _request_builder: typ.ClassVar[UpdateRequestBuilder]
+    _update_service_fn: typ.ClassVar[EntityServiceFn]
+    _update_serializer_fn: typ.ClassVar[EntitySerializerFn]
+    _required_fields: typ.ClassVar[tuple[str, ...]] = ("expected_revision",)
 
     async def on_patch(
         self,
@@ -253,14 +225,15 @@ class _UpdateResourceBase[EntityT: object](_ResourceBase, ABC):
         **kwargs: str,
     ) -> None:
         """Update one entity by identifier."""
+        cls = type(self)
         payload = require_payload_dict(await req.get_media())
         resp.media, resp.status = await handle_update_entity(
             uow_factory=self._uow_factory,
-            entity_id=self._get_entity_id_from_path(**kwargs),
-            id_field_name=self._get_id_field_name(),
+            entity_id=kwargs[cls._id_field_name],
+            id_field_name=cls._id_field_name,
             payload=payload,
-            required_fields=self._get_required_fields(),
-            request_builder=self._get_request_builder(),
-            service_fn=self._get_update_service_fn(),
-            serializer_fn=self._get_update_serializer_fn(),
+            required_fields=cls._required_fields,
+            request_builder=cls._request_builder,
+            service_fn=cls._update_service_fn,
+            serializer_fn=cls._update_serializer_fn,
         )
@@ -13,10 +13,8 @@ Examples
 
 import typing as typ
 from functools import partial
-from itertools import starmap
-
-import falcon
 
+from episodic.api.handlers import write_json_with_etag
 from episodic.api.helpers import (
     build_template_create_kwargs,
     build_template_update_request,
@@ -24,7 +22,8 @@ from episodic.api.helpers import (
     parse_pagination,
 )
 from episodic.api.resources.base import (
-    UpdateRequestBuilder,
+    EntitySerializerFn,
+    EntityServiceFn,
     _CreateResourceBase,
     _GetHistoryResourceBase,
     _GetResourceBase,
@@ -33,8 +32,10 @@ from episodic.api.resources.base import (
 from episodic.api.serializers import (
     serialize_episode_template,
     serialize_episode_template_history_entry,
+    serialize_episode_templates,
 )
 from episodic.canonical.profile_templates import (
+    count_history,
     create_episode_template,
     get_entity_with_revision,
     list_entities_with_revisions_paged,
@@ -45,10 +46,24 @@ from episodic.canonical.profile_templates import (
 if typ.TYPE_CHECKING:
     import collections.abc as cabc
 
+    import falcon
+
     from episodic.api.types import JsonPayload
+    from episodic.canonical.domain import EpisodeTemplate
+
+
+# NOTE: module-level so list requests reuse one partial; the cast narrows the
+# generic service's ``object`` entities for the typed serializer.
+type _TemplateListFn = cabc.Callable[
+    ..., cabc.Awaitable[tuple[list[tuple[EpisodeTemplate, int]], int]]
+]
+_LIST_EPISODE_TEMPLATES = typ.cast(
+    "_TemplateListFn",
+    partial(list_entities_with_revisions_paged, kind="episode_template"),
+)
 
 
-class EpisodeTemplatesResource(_CreateResourceBase[object]):
+class EpisodeTemplatesResource(_CreateResourceBase):
     """Handle collection operations for episode templates.
 
     Parameters
@@ -57,6 +72,8 @@ class EpisodeTemplatesResource(_CreateResourceBase[object]):
         Factory used to create request-scoped units of work.
     """
 
+    __slots__ = ()
+
     async def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
         """List episode templates.
 
@@ -70,7 +87,8 @@ class EpisodeTemplatesResource(_CreateResourceBase[object]):
         Returns
         -------
         None
-            Response media is set to an ``items`` list and status ``200``.
+            The response body holds an ``items`` list with status ``200``,
+            or is empty with status ``304`` when ``If-None-Match`` matches.
 
         Raises
         ------
@@ -81,59 +99,33 @@ class EpisodeTemplatesResource(_CreateResourceBase[object]):
         series_profile_id = parse_optional_uuid_param(req, "series_profile_id")
 
         async with self._uow_factory() as uow:
-            service_fn = partial(
-                list_entities_with_revisions_paged,
-                kind="episode_template",
-                page=page,
-            )
-            items, total = await service_fn(
+            items, total = await _LIST_EPISODE_TEMPLATES(
                 uow,
+                page=page,
                 series_profile_id=series_profile_id,
             )
 
-        resp.media = {
-            "items": list(starmap(serialize_episode_template, items)),
-            "limit": page.limit,
-            "offset": page.offset,
-            "total": total,
-        }
-        resp.status = falcon.HTTP_200
-
-    @staticmethod
-    @typ.override
-    def _get_required_fields() -> tuple[str, ...]:
-        """Return required payload fields for template creation."""
-        return ("series_profile_id", "slug", "title", "structure")
-
-    @staticmethod
-    @typ.override
-    def _get_kwargs_builder() -> cabc.Callable[[JsonPayload], dict[str, object]]:
-        """Return the template create kwargs builder."""
-        return build_template_create_kwargs
-
-    @staticmethod
-    @typ.override
-    def _get_service_fn() -> cabc.Callable[..., cabc.Awaitable[tuple[object, int]]]:
-        """Return the template create service."""
-        return typ.cast(
-            "cabc.Callable[..., cabc.Awaitable[tuple[object, int]]]",
-            create_episode_template,
+        write_json_with_etag(
+            req,
+            resp,
+            {
+                "items": serialize_episode_templates(items),
+                "limit": page.limit,
+                "offset": page.offset,
+                "total": total,
+            },
         )
 
-    @staticmethod
-    @typ.override
-    def _get_serializer_fn() -> cabc.Callable[[object, int], JsonPayload]:
-        """Return the template serializer."""
-        return typ.cast(
-            "cabc.Callable[[object, int], JsonPayload]",
-            serialize_episode_template,
-        )
+    _required_fields = ("series_profile_id", "slug", "title", "structure")
+    _kwargs_builder = build_template_create_kwargs
+    _service_fn = typ.cast("EntityServiceFn", create_episode_template)
+    _serializer_fn = typ.cast("EntitySerializerFn", serialize_episode_template)
 
 
 # NOTE: Intentional MRO-safe diamond inheritance: both parent ``__init__``
 # implementations are identical, and placing ``_UpdateResourceBase`` first
 # ensures patch-specific hooks resolve before shared get-by-id behavior.
-class EpisodeTemplateResource(_UpdateResourceBase[object], _GetResourceBase[object]):
+class EpisodeTemplateResource(_UpdateResourceBase, _GetResourceBase):
     """Handle single-entity operations for episode templates.
 
     Parameters
@@ -142,70 +134,21 @@ class EpisodeTemplateResource(_UpdateResourceBase[object], _GetResourceBase[obje
         Factory used to create request-scoped units of work.
     """
 
-    @staticmethod
-    @typ.override
-    def _get_entity_id_from_path(**kwargs: str) -> str:
-        """Return the template identifier from route params."""
-        return kwargs["template_id"]
-
-    @staticmethod
-    @typ.override
-    def _get_id_field_name() -> str:
-        """Return the template identifier service argument."""
-        return "template_id"
-
-    @staticmethod
-    @typ.override
-    def _get_service_fn() -> cabc.Callable[..., cabc.Awaitable[tuple[object, int]]]:
-        """Return the template fetch service."""
-        return typ.cast(
-            "cabc.Callable[..., cabc.Awaitable[tuple[object, int]]]",
-            partial(get_entity_with_revision, kind="episode_template"),
-        )
-
-    @staticmethod
-    @typ.override
-    def _get_serializer_fn() -> cabc.Callable[[object, int], JsonPayload]:
-        """Return the template serializer."""
-        return typ.cast(
-            "cabc.Callable[[object, int], JsonPayload]",
-            serialize_episode_template,
-        )
-
-    @staticmethod
-    @typ.override
-    def _get_request_builder() -> UpdateRequestBuilder:
-        """Return the template update-request builder."""
-        return build_template_update_request
-
-    @staticmethod
-    @typ.override
-    def _get_update_service_fn() -> cabc.Callable[
-        ..., cabc.Awaitable[tuple[object, int]]
-    ]:
-        """Return the template update service."""
-        return typ.cast(
-            "cabc.Callable[..., cabc.Awaitable[tuple[object, int]]]",
-            update_episode_template,
-        )
+    __slots__ = ()
 
-    @staticmethod
-    @typ.override
-    def _get_update_serializer_fn() -> cabc.Callable[[object, int], JsonPayload]:
-        """Return the template update serializer."""
-        return typ.cast(
-            "cabc.Callable[[object, int], JsonPayload]",
-            serialize_episode_template,
-        )
-
-    @staticmethod
-    @typ.override
-    def _get_required_fields() -> tuple[str, ...]:
-        """Return required payload fields for template updates."""
-        return ("expected_revision", "title", "structure")
+    _id_field_name = "template_id"
+    _service_fn = typ.cast(
+        "EntityServiceFn",
+        partial(get_entity_with_revision, kind="episode_template"),
+    )
+    _serializer_fn = typ.cast("EntitySerializerFn", serialize_episode_template)
+    _request_builder = build_template_update_request
+    _update_service_fn = typ.cast("EntityServiceFn", update_episode_template)
+    _update_serializer_fn = typ.cast("EntitySerializerFn", serialize_episode_template)
+    _required_fields = ("expected_revision", "title", "structure")
 
 
-class EpisodeTemplateHistoryResource(_GetHistoryResourceBase[object]):
+class EpisodeTemplateHistoryResource(_GetHistoryResourceBase):
     """Handle history retrieval for episode templates.
 
     Parameters
@@ -214,35 +157,15 @@ class EpisodeTemplateHistoryResource(_GetHistoryResourceBase[object]):
         Factory used to create request-scoped units of work.
     """
 
-    @staticmethod
-    @typ.override
-    def _get_entity_id_from_path(**kwargs: str) -> str:
-        """Return the template identifier from route params."""
-        return kwargs["template_id"]
-
-    @staticmethod
-    @typ.override
-    def _get_id_field_name() -> str:
-        """Return the template identifier service argument."""
-        return "template_id"
-
-    @staticmethod
-    @typ.override
-    def _get_service_fn() -> cabc.Callable[
-        ...,
-        cabc.Awaitable[tuple[list[object], int]],
-    ]:
-        """Return the template-history list service."""
-        return typ.cast(
-            "cabc.Callable[..., cabc.Awaitable[tuple[list[object], int]]]",
-            partial(list_history_paged, kind="episode_template"),
-        )
-
-    @staticmethod
-    @typ.override
-    def _get_serializer_fn() -> cabc.Callable[[object], JsonPayload]:
-        """Return the template-history serializer."""
-        return typ.cast(
-            "cabc.Callable[[object], JsonPayload]",
-            serialize_episode_template_history_entry,
-        )
+    __slots__ = ()
+
+    _id_field_name = "template_id"
+    _service_fn = typ.cast(
+        "cabc.Callable[..., cabc.Awaitable[tuple[list[object], int]]]",
+        partial(list_history_paged, kind="episode_template"),
+    )
+    _serializer_fn = typ.cast(
+        "cabc.Callable[[object], JsonPayload]",
+        serialize_episode_template_history_entry,
+    )
+    _count_fn = partial(count_history, kind="episode_template")
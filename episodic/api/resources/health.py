@@ -21,6 +21,8 @@ def _build_check_payload(name: str, status: str) -> HealthCheckPayload:
 class HealthLiveResource:
     """Serve a process liveness response once the app has booted."""
 
+    __slots__ = ("_application_check_name",)
+
     def __init__(self) -> None:
         self._application_check_name = "application"
 
@@ -37,6 +39,8 @@ class HealthLiveResource:
 class HealthReadyResource:
     """Serve a readiness response based on a domain health observer."""
 
+    __slots__ = ("_health_observer",)
+
     def __init__(self, health_observer: HealthObserver) -> None:
         self._health_observer = health_observer
 
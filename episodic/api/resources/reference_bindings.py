@@ -27,9 +27,22 @@ if typ.TYPE_CHECKING:
     from episodic.api.types import UowFactory
 
 
+class _BindingFieldsPayload(typ.TypedDict):
+    """Reference-binding fields carried by create payloads."""
+
+    reference_document_revision_id: str
+    target_kind: str
+    series_profile_id: typ.NotRequired[str | None]
+    episode_template_id: typ.NotRequired[str | None]
+    ingestion_job_id: typ.NotRequired[str | None]
+    effective_from_episode_id: typ.NotRequired[str | None]
+
+
 class ReferenceBindingsResource:
     """Handle create/list endpoints for reusable reference bindings."""
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
@@ -45,19 +58,14 @@ class ReferenceBindingsResource:
             msg = f"Missing required field: {missing[0]}"
             raise falcon.HTTPBadRequest(description=msg)
 
+        fields = typ.cast("_BindingFieldsPayload", payload)
         data = ReferenceBindingData(
-            reference_document_revision_id=typ.cast(
-                "str", payload["reference_document_revision_id"]
-            ),
-            target_kind=typ.cast("str", payload["target_kind"]),
-            series_profile_id=typ.cast("str | None", payload.get("series_profile_id")),
-            episode_template_id=typ.cast(
-                "str | None", payload.get("episode_template_id")
-            ),
-            ingestion_job_id=typ.cast("str | None", payload.get("ingestion_job_id")),
-            effective_from_episode_id=typ.cast(
-                "str | None", payload.get("effective_from_episode_id")
-            ),
+            reference_document_revision_id=fields["reference_document_revision_id"],
+            target_kind=fields["target_kind"],
+            series_profile_id=fields.get("series_profile_id"),
+            episode_template_id=fields.get("episode_template_id"),
+            ingestion_job_id=fields.get("ingestion_job_id"),
+            effective_from_episode_id=fields.get("effective_from_episode_id"),
         )
 
         try:
@@ -104,6 +112,8 @@ class ReferenceBindingsResource:
 class ReferenceBindingResource:
     """Handle get endpoint for one reusable reference binding."""
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
@@ -36,6 +36,30 @@ from episodic.canonical.reference_documents import (
 if typ.TYPE_CHECKING:
     from episodic.api.types import JsonPayload, UowFactory
 
+_INVALID_LOCK_VERSION_MSG = "expected_lock_version must be a positive integer."
+
+
+class _DocumentUpdatePayload(typ.TypedDict):
+    """Reference-document fields carried by update payloads."""
+
+    lifecycle_state: str
+    metadata: dict[str, object]
+
+
+class _DocumentCreatePayload(_DocumentUpdatePayload):
+    """Reference-document fields carried by create payloads."""
+
+    kind: str
+
+
+class _RevisionFieldsPayload(typ.TypedDict):
+    """Reference-document revision fields carried by create payloads."""
+
+    content: dict[str, object]
+    content_hash: str
+    author: typ.NotRequired[str | None]
+    change_note: typ.NotRequired[str | None]
+
 
 def _require_fields(payload: JsonPayload, *fields: str) -> None:
     """Raise HTTPBadRequest if any required field is absent from payload."""
@@ -51,29 +75,26 @@ def _parse_expected_lock_version(payload: JsonPayload) -> int:
     if raw_expected is None:
         msg = "Missing required field: expected_lock_version"
         raise falcon.HTTPBadRequest(description=msg)
-    if isinstance(raw_expected, bool):
-        msg = "expected_lock_version must be a positive integer."
-        raise falcon.HTTPBadRequest(description=msg)
-    if isinstance(raw_expected, float):
-        msg = "expected_lock_version must be a positive integer."
-        raise falcon.HTTPBadRequest(description=msg)
+    # ``int()`` would silently accept booleans and truncate floats, so reject
+    # those spellings before coercion.
+    if isinstance(raw_expected, bool | float):
+        raise falcon.HTTPBadRequest(description=_INVALID_LOCK_VERSION_MSG)
     if isinstance(raw_expected, str) and "." in raw_expected:
-        msg = "expected_lock_version must be a positive integer."
-        raise falcon.HTTPBadRequest(description=msg)
+        raise falcon.HTTPBadRequest(description=_INVALID_LOCK_VERSION_MSG)
     try:
         expected = int(typ.cast("int | str", raw_expected))
     except (TypeError, ValueError) as exc:
-        msg = "expected_lock_version must be a positive integer."
-        raise falcon.HTTPBadRequest(description=msg) from exc
+        raise falcon.HTTPBadRequest(description=_INVALID_LOCK_VERSION_MSG) from exc
     if expected < 1:
-        msg = "expected_lock_version must be a positive integer."
-        raise falcon.HTTPBadRequest(description=msg)
+        raise falcon.HTTPBadRequest(description=_INVALID_LOCK_VERSION_MSG)
     return expected
 
 
 class ReferenceDocumentsResource:
     """Handle collection endpoints for reusable reference documents."""
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
@@ -87,12 +108,13 @@ class ReferenceDocumentsResource:
         """Create one reusable reference document for a series profile."""
         payload = require_payload_dict(await req.get_media())
         _require_fields(payload, "kind", "lifecycle_state", "metadata")
+        fields = typ.cast("_DocumentCreatePayload", payload)
 
         data = ReferenceDocumentCreateData(
             owner_series_profile_id=str(parse_uuid(profile_id, "profile_id")),
-            kind=typ.cast("str", payload["kind"]),
-            lifecycle_state=typ.cast("str", payload["lifecycle_state"]),
-            metadata=typ.cast("dict[str, object]", payload["metadata"]),
+            kind=fields["kind"],
+            lifecycle_state=fields["lifecycle_state"],
+            metadata=fields["metadata"],
         )
 
         try:
@@ -143,6 +165,8 @@ class ReferenceDocumentsResource:
 class ReferenceDocumentResource:
     """Handle read/update endpoints for one reusable reference document."""
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
@@ -180,13 +204,14 @@ class ReferenceDocumentResource:
         """Update one reusable reference document with optimistic locking."""
         payload = require_payload_dict(await req.get_media())
         _require_fields(payload, "lifecycle_state", "metadata")
+        fields = typ.cast("_DocumentUpdatePayload", payload)
 
         request = ReferenceDocumentUpdateRequest(
             document_id=str(parse_uuid(document_id, "document_id")),
             owner_series_profile_id=str(parse_uuid(profile_id, "profile_id")),
             expected_lock_version=_parse_expected_lock_version(payload),
-            lifecycle_state=typ.cast("str", payload["lifecycle_state"]),
-            metadata=typ.cast("dict[str, object]", payload["metadata"]),
+            lifecycle_state=fields["lifecycle_state"],
+            metadata=fields["metadata"],
         )
 
         try:
@@ -205,6 +230,8 @@ class ReferenceDocumentResource:
 class ReferenceDocumentRevisionsResource:
     """Handle create/list endpoints for one document's immutable revisions."""
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
@@ -219,12 +246,13 @@ class ReferenceDocumentRevisionsResource:
         """Create one immutable revision for a reusable reference document."""
         payload = require_payload_dict(await req.get_media())
         _require_fields(payload, "content", "content_hash")
+        fields = typ.cast("_RevisionFieldsPayload", payload)
 
         data = ReferenceDocumentRevisionData(
-            content=typ.cast("dict[str, object]", payload["content"]),
-            content_hash=typ.cast("str", payload["content_hash"]),
-            author=typ.cast("str | None", payload.get("author")),
-            change_note=typ.cast("str | None", payload.get("change_note")),
+            content=fields["content"],
+            content_hash=fields["content_hash"],
+            author=fields.get("author"),
+            change_note=fields.get("change_note"),
         )
 
         try:
@@ -282,6 +310,8 @@ class ReferenceDocumentRevisionsResource:
 class ReferenceDocumentRevisionResource:
     """Handle get endpoint for one immutable reference-document revision."""
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
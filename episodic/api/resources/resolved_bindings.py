@@ -6,7 +6,6 @@ import falcon
 
 from episodic.api.helpers import parse_pagination, parse_uuid, require_query_params
 from episodic.api.serializers import serialize_resolved_binding
-from episodic.canonical.profile_templates import EntityNotFoundError
 from episodic.canonical.reference_documents import resolve_bindings
 
 if typ.TYPE_CHECKING:
@@ -16,6 +15,8 @@ if typ.TYPE_CHECKING:
 class ResolvedBindingsResource:
     """Return resolved reference bindings for a series profile context."""
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
@@ -37,41 +38,35 @@ class ResolvedBindingsResource:
             else parse_uuid(raw_template_id, "template_id")
         )
 
-        try:
-            async with self._uow_factory() as uow:
-                profile = await uow.series_profiles.get(parsed_profile_id)
-                if profile is None:
-                    msg = f"Series profile not found: {parsed_profile_id}."
-                    raise falcon.HTTPNotFound(description=msg)
+        async with self._uow_factory() as uow:
+            profile = await uow.series_profiles.get(parsed_profile_id)
+            if profile is None:
+                msg = f"Series profile not found: {parsed_profile_id}."
+                raise falcon.HTTPNotFound(description=msg)
+
+            episode = await uow.episodes.get(parsed_episode_id)
+            if episode is None or episode.series_profile_id != parsed_profile_id:
+                msg = (
+                    f"Episode not found or does not belong to "
+                    f"series profile: {parsed_episode_id}."
+                )
+                raise falcon.HTTPNotFound(description=msg)
 
-                episode = await uow.episodes.get(parsed_episode_id)
-                if episode is None or episode.series_profile_id != parsed_profile_id:
+            if template_id is not None:
+                template = await uow.episode_templates.get(template_id)
+                if template is None or template.series_profile_id != parsed_profile_id:
                     msg = (
-                        f"Episode not found or does not belong to "
-                        f"series profile: {parsed_episode_id}."
+                        f"Episode template not found or does not belong to "
+                        f"series profile: {template_id}."
                     )
                     raise falcon.HTTPNotFound(description=msg)
 
-                if template_id is not None:
-                    template = await uow.episode_templates.get(template_id)
-                    if (
-                        template is None
-                        or template.series_profile_id != parsed_profile_id
-                    ):
-                        msg = (
-                            f"Episode template not found or does not belong to "
-                            f"series profile: {template_id}."
-                        )
-                        raise falcon.HTTPNotFound(description=msg)
-
-                resolved = await resolve_bindings(
-                    uow,
-                    series_profile_id=parsed_profile_id,
-                    template_id=template_id,
-                    episode_id=parsed_episode_id,
-                )
-        except EntityNotFoundError as exc:
-            raise falcon.HTTPNotFound(description=str(exc)) from exc
+            resolved = await resolve_bindings(
+                uow,
+                series_profile_id=parsed_profile_id,
+                template_id=template_id,
+                episode_id=parsed_episode_id,
+            )
 
         total = len(resolved)
         resp.media = {
@@ -12,10 +12,8 @@ Examples
 
 import typing as typ
 from functools import partial
-from itertools import starmap
-
-import falcon
 
+from episodic.api.handlers import write_json_with_etag
 from episodic.api.helpers import (
     build_profile_create_kwargs,
     build_profile_update_request,
@@ -23,7 +21,8 @@ from episodic.api.helpers import (
     parse_uuid,
 )
 from episodic.api.resources.base import (
-    UpdateRequestBuilder,
+    EntitySerializerFn,
+    EntityServiceFn,
     _CreateResourceBase,
     _GetHistoryResourceBase,
     _GetResourceBase,
@@ -32,10 +31,11 @@ from episodic.api.resources.base import (
 from episodic.api.serializers import (
     serialize_series_profile,
     serialize_series_profile_history_entry,
+    serialize_series_profiles,
 )
 from episodic.canonical.briefs import build_series_brief
 from episodic.canonical.profile_templates import (
-    EntityNotFoundError,
+    count_history,
     create_series_profile,
     get_entity_with_revision,
     list_entities_with_revisions_paged,
@@ -46,10 +46,24 @@ from episodic.canonical.profile_templates import (
 if typ.TYPE_CHECKING:
     import collections.abc as cabc
 
+    import falcon
+
     from episodic.api.types import JsonPayload, UowFactory
+    from episodic.canonical.domain import SeriesProfile
+
+
+# NOTE: module-level so list requests reuse one partial; the cast narrows the
+# generic service's ``object`` entities for the typed serializer.
+type _ProfileListFn = cabc.Callable[
+    ..., cabc.Awaitable[tuple[list[tuple[SeriesProfile, int]], int]]
+]
+_LIST_SERIES_PROFILES = typ.cast(
+    "_ProfileListFn",
+    partial(list_entities_with_revisions_paged, kind="series_profile"),
+)
 
 
-class SeriesProfilesResource(_CreateResourceBase[object]):
+class SeriesProfilesResource(_CreateResourceBase):
     """Handle collection operations for series profiles.
 
     Parameters
@@ -63,6 +77,8 @@ class SeriesProfilesResource(_CreateResourceBase[object]):
         Raised when required payload fields are missing during creation.
     """
 
+    __slots__ = ()
+
     async def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
         """List all series profiles.
 
@@ -76,60 +92,34 @@ class SeriesProfilesResource(_CreateResourceBase[object]):
         Returns
         -------
         None
-            Response media is set to an ``items`` list and status ``200``.
+            The response body holds an ``items`` list with status ``200``,
+            or is empty with status ``304`` when ``If-None-Match`` matches.
         """
         page = parse_pagination(req)
-        service_fn = partial(
-            list_entities_with_revisions_paged,
-            kind="series_profile",
-            page=page,
-        )
         async with self._uow_factory() as uow:
-            items, total = await service_fn(uow)
-
-        resp.media = {
-            "items": list(starmap(serialize_series_profile, items)),
-            "limit": page.limit,
-            "offset": page.offset,
-            "total": total,
-        }
-        resp.status = falcon.HTTP_200
-
-    @staticmethod
-    @typ.override
-    def _get_required_fields() -> tuple[str, ...]:
-        """Return required payload fields for profile creation."""
-        return ("slug", "title", "configuration")
-
-    @staticmethod
-    @typ.override
-    def _get_kwargs_builder() -> cabc.Callable[[JsonPayload], dict[str, object]]:
-        """Return the profile create kwargs builder."""
-        return build_profile_create_kwargs
-
-    @staticmethod
-    @typ.override
-    def _get_service_fn() -> cabc.Callable[..., cabc.Awaitable[tuple[object, int]]]:
-        """Return the profile create service."""
-        return typ.cast(
-            "cabc.Callable[..., cabc.Awaitable[tuple[object, int]]]",
-            create_series_profile,
+            items, total = await _LIST_SERIES_PROFILES(uow, page=page)
+
+        write_json_with_etag(
+            req,
+            resp,
+            {
+                "items": serialize_series_profiles(items),
+                "limit": page.limit,
+                "offset": page.offset,
+                "total": total,
+            },
         )
 
-    @staticmethod
-    @typ.override
-    def _get_serializer_fn() -> cabc.Callable[[object, int], JsonPayload]:
-        """Return the profile serializer."""
-        return typ.cast(
-            "cabc.Callable[[object, int], JsonPayload]",
-            serialize_series_profile,
-        )
+    _required_fields = ("slug", "title", "configuration")
+    _kwargs_builder = build_profile_create_kwargs
+    _service_fn = typ.cast("EntityServiceFn", create_series_profile)
+    _serializer_fn = typ.cast("EntitySerializerFn", serialize_series_profile)
 
 
 # NOTE: Intentional MRO-safe diamond inheritance: both parent ``__init__``
 # implementations are identical, and placing ``_UpdateResourceBase`` first
 # ensures patch-specific hooks resolve before shared get-by-id behavior.
-class SeriesProfileResource(_UpdateResourceBase[object], _GetResourceBase[object]):
+class SeriesProfileResource(_UpdateResourceBase, _GetResourceBase):
     """Handle single-entity operations for series profiles.
 
     Parameters
@@ -138,70 +128,21 @@ class SeriesProfileResource(_UpdateResourceBase[object], _GetResourceBase[object
         Factory used to create request-scoped units of work.
     """
 
-    @staticmethod
-    @typ.override
-    def _get_entity_id_from_path(**kwargs: str) -> str:
-        """Return the profile identifier from route params."""
-        return kwargs["profile_id"]
-
-    @staticmethod
-    @typ.override
-    def _get_id_field_name() -> str:
-        """Return the profile identifier service argument."""
-        return "profile_id"
-
-    @staticmethod
-    @typ.override
-    def _get_service_fn() -> cabc.Callable[..., cabc.Awaitable[tuple[object, int]]]:
-        """Return the profile fetch service."""
-        return typ.cast(
-            "cabc.Callable[..., cabc.Awaitable[tuple[object, int]]]",
-            partial(get_entity_with_revision, kind="series_profile"),
-        )
+    __slots__ = ()
 
-    @staticmethod
-    @typ.override
-    def _get_serializer_fn() -> cabc.Callable[[object, int], JsonPayload]:
-        """Return the profile serializer."""
-        return typ.cast(
-            "cabc.Callable[[object, int], JsonPayload]",
-            serialize_series_profile,
-        )
+    _id_field_name = "profile_id"
+    _service_fn = typ.cast(
+        "EntityServiceFn",
+        partial(get_entity_with_revision, kind="series_profile"),
+    )
+    _serializer_fn = typ.cast("EntitySerializerFn", serialize_series_profile)
+    _request_builder = build_profile_update_request
+    _update_service_fn = typ.cast("EntityServiceFn", update_series_profile)
+    _update_serializer_fn = typ.cast("EntitySerializerFn", serialize_series_profile)
+    _required_fields = ("expected_revision", "title", "configuration")
 
-    @staticmethod
-    @typ.override
-    def _get_request_builder() -> UpdateRequestBuilder:
-        """Return the profile update-request builder."""
-        return build_profile_update_request
-
-    @staticmethod
-    @typ.override
-    def _get_update_service_fn() -> cabc.Callable[
-        ..., cabc.Awaitable[tuple[object, int]]
-    ]:
-        """Return the profile update service."""
-        return typ.cast(
-            "cabc.Callable[..., cabc.Awaitable[tuple[object, int]]]",
-            update_series_profile,
-        )
 
-    @staticmethod
-    @typ.override
-    def _get_update_serializer_fn() -> cabc.Callable[[object, int], JsonPayload]:
-        """Return the profile update serializer."""
-        return typ.cast(
-            "cabc.Callable[[object, int], JsonPayload]",
-            serialize_series_profile,
-        )
-
-    @staticmethod
-    @typ.override
-    def _get_required_fields() -> tuple[str, ...]:
-        """Return required payload fields for profile updates."""
-        return ("expected_revision", "title", "configuration")
-
-
-class SeriesProfileHistoryResource(_GetHistoryResourceBase[object]):
+class SeriesProfileHistoryResource(_GetHistoryResourceBase):
     """Handle history retrieval for series profiles.
 
     Parameters
@@ -210,38 +151,18 @@ class SeriesProfileHistoryResource(_GetHistoryResourceBase[object]):
         Factory used to create request-scoped units of work.
     """
 
-    @staticmethod
-    @typ.override
-    def _get_entity_id_from_path(**kwargs: str) -> str:
-        """Return the profile identifier from route params."""
-        return kwargs["profile_id"]
-
-    @staticmethod
-    @typ.override
-    def _get_id_field_name() -> str:
-        """Return the profile identifier service argument."""
-        return "profile_id"
-
-    @staticmethod
-    @typ.override
-    def _get_service_fn() -> cabc.Callable[
-        ...,
-        cabc.Awaitable[tuple[list[object], int]],
-    ]:
-        """Return the profile-history list service."""
-        return typ.cast(
-            "cabc.Callable[..., cabc.Awaitable[tuple[list[object], int]]]",
-            partial(list_history_paged, kind="series_profile"),
-        )
+    __slots__ = ()
 
-    @staticmethod
-    @typ.override
-    def _get_serializer_fn() -> cabc.Callable[[object], JsonPayload]:
-        """Return the profile-history serializer."""
-        return typ.cast(
-            "cabc.Callable[[object], JsonPayload]",
-            serialize_series_profile_history_entry,
-        )
+    _id_field_name = "profile_id"
+    _service_fn = typ.cast(
+        "cabc.Callable[..., cabc.Awaitable[tuple[list[object], int]]]",
+        partial(list_history_paged, kind="series_profile"),
+    )
+    _serializer_fn = typ.cast(
+        "cabc.Callable[[object], JsonPayload]",
+        serialize_series_profile_history_entry,
+    )
+    _count_fn = partial(count_history, kind="series_profile")
 
 
 class SeriesProfileBriefResource:
@@ -253,6 +174,8 @@ class SeriesProfileBriefResource:
         Factory used to create request-scoped units of work.
     """
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
@@ -276,7 +199,8 @@ class SeriesProfileBriefResource:
         Returns
         -------
         None
-            Response media is set to the brief payload and status ``200``.
+            The response body holds the brief payload with status ``200``,
+            or is empty with status ``304`` when ``If-None-Match`` matches.
 
         Raises
         ------
@@ -306,16 +230,12 @@ class SeriesProfileBriefResource:
             )
         )
 
-        try:
-            async with self._uow_factory() as uow:
-                payload = await build_series_brief(
-                    uow,
-                    profile_id=parsed_profile_id,
-                    template_id=template_id,
-                    episode_id=episode_id,
-                )
-        except EntityNotFoundError as exc:
-            raise falcon.HTTPNotFound(description=str(exc)) from exc
-
-        resp.media = payload
-        resp.status = falcon.HTTP_200
+        async with self._uow_factory() as uow:
+            payload = await build_series_brief(
+                uow,
+                profile_id=parsed_profile_id,
+                template_id=template_id,
+                episode_id=episode_id,
+            )
+
+        write_json_with_etag(req, resp, payload)
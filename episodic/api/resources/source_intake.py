@@ -62,6 +62,8 @@ _INGESTION_SOURCE_OPERATION = "ingestion_job.source.attach"
 class UploadsResource:
     """Handle single-shot source upload creation."""
 
+    __slots__ = ("_config", "_uow_factory")
+
     def __init__(
         self,
         uow_factory: UowFactory,
@@ -135,6 +137,8 @@ class UploadsResource:
 class UploadResource:
     """Handle one source upload metadata endpoint."""
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
@@ -159,6 +163,8 @@ class UploadResource:
 class IngestionJobsResource:
     """Handle ingestion-job collection endpoints."""
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
@@ -222,6 +228,8 @@ class IngestionJobsResource:
 class IngestionJobResource:
     """Handle one ingestion-job status endpoint."""
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
@@ -252,6 +260,8 @@ class IngestionJobResource:
 class IngestionJobSourcesResource:
     """Handle source attachments for an ingestion job."""
 
+    __slots__ = ("_uow_factory",)
+
     def __init__(self, uow_factory: UowFactory) -> None:
         self._uow_factory = uow_factory
 
@@ -4,6 +4,8 @@ import typing as typ
 import uuid  # noqa: TC003
 
 if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
     from episodic.canonical.domain import (
         EpisodeTemplate,
         EpisodeTemplateHistoryEntry,
@@ -36,6 +38,31 @@ def serialize_series_profile(
     }
 
 
+def serialize_series_profiles(
+    rows: cabc.Iterable[tuple[SeriesProfile, int]],
+) -> list[dict[str, typ.Any]]:
+    """Serialize ``(profile, revision)`` rows for a list response.
+
+    The payload is built inline rather than by calling
+    :func:`serialize_series_profile` per row, so a list page costs one frame;
+    the two must stay field-for-field identical.
+    """
+    return [
+        {
+            "id": str(profile.id),
+            "slug": profile.slug,
+            "title": profile.title,
+            "description": profile.description,
+            "configuration": profile.configuration,
+            "guardrails": profile.guardrails,
+            "revision": revision,
+            "created_at": profile.created_at.isoformat(),
+            "updated_at": profile.updated_at.isoformat(),
+        }
+        for profile, revision in rows
+    ]
+
+
 def serialize_episode_template(
     template: EpisodeTemplate,
     revision: int,
@@ -55,15 +82,38 @@ def serialize_episode_template(
     }
 
 
-def _serialize_history_entry(
-    entry: SeriesProfileHistoryEntry | EpisodeTemplateHistoryEntry,
-    parent_id_field: str,
+def serialize_episode_templates(
+    rows: cabc.Iterable[tuple[EpisodeTemplate, int]],
+) -> list[dict[str, typ.Any]]:
+    """Serialize ``(template, revision)`` rows for a list response.
+
+    Built inline like :func:`serialize_series_profiles`; keep the fields in
+    step with :func:`serialize_episode_template`.
+    """
+    return [
+        {
+            "id": str(template.id),
+            "series_profile_id": str(template.series_profile_id),
+            "slug": template.slug,
+            "title": template.title,
+            "description": template.description,
+            "structure": template.structure,
+            "guardrails": template.guardrails,
+            "revision": revision,
+            "created_at": template.created_at.isoformat(),
+            "updated_at": template.updated_at.isoformat(),
+        }
+        for template, revision in rows
+    ]
+
+
+def serialize_series_profile_history_entry(
+    entry: SeriesProfileHistoryEntry,
 ) -> dict[str, typ.Any]:
-    """Serialize a history entry to JSON."""
-    parent_id = getattr(entry, parent_id_field)
+    """Serialize a profile history entry."""
     return {
         "id": str(entry.id),
-        parent_id_field: str(parent_id),
+        "series_profile_id": str(entry.series_profile_id),
         "revision": entry.revision,
         "actor": entry.actor,
         "note": entry.note,
@@ -72,18 +122,19 @@ def _serialize_history_entry(
     }
 
 
-def serialize_series_profile_history_entry(
-    entry: SeriesProfileHistoryEntry,
-) -> dict[str, typ.Any]:
-    """Serialize a profile history entry."""
-    return _serialize_history_entry(entry, "series_profile_id")
-
-
 def serialize_episode_template_history_entry(
     entry: EpisodeTemplateHistoryEntry,
 ) -> dict[str, typ.Any]:
     """Serialize an episode-template history entry."""
-    return _serialize_history_entry(entry, "episode_template_id")
+    return {
+        "id": str(entry.id),
+        "episode_template_id": str(entry.episode_template_id),
+        "revision": entry.revision,
+        "actor": entry.actor,
+        "note": entry.note,
+        "snapshot": entry.snapshot,
+        "created_at": entry.created_at.isoformat(),
+    }
 
 
 def _optional_uuid_str(value: uuid.UUID | None) -> str | None:
@@ -38,101 +38,92 @@ class TaskCreateKwargs(typ.TypedDict, total=False):
 _TASK_CREATE_KWARGS_KEYS = frozenset({"name", "context", "eager_start", "metadata"})
 
 
-def _validate_string_metadata_field(
-    metadata: TaskMetadata,
-    field_name: str,
-) -> str | None:
-    """Validate one optional string metadata field."""
-    value = metadata.get(field_name)
-    if value is None:
-        return None
-    if not isinstance(value, str):
-        msg = (
-            f"Task metadata {field_name!r} must be a string, "
-            f"got {type(value).__name__!r}."
-        )
-        raise TypeError(msg)
-    if not value:
-        msg = f"Task metadata {field_name!r} must be a non-empty string."
-        raise ValueError(msg)
-    return value
-
-
-def _validate_priority_hint_field(metadata: TaskMetadata) -> int | None:
-    """Validate the optional integer priority hint field."""
-    priority_hint = metadata.get("priority_hint")
-    if priority_hint is None:
-        return None
-    if isinstance(priority_hint, bool) or not isinstance(priority_hint, int):
-        msg = "Task metadata 'priority_hint' must be an integer."
-        raise TypeError(msg)
-    return priority_hint
+def _raise_unsupported_metadata_keys(metadata: TaskMetadata) -> typ.NoReturn:
+    """Raise ``ValueError`` naming metadata keys outside the supported set."""
+    unsupported_keys = set(metadata) - _TASK_METADATA_KEYS
+    keys = ", ".join(repr(key) for key in sorted(unsupported_keys, key=repr))
+    msg = f"Unsupported task metadata keys: {keys}"
+    raise ValueError(msg)
+
+
+def _raise_unsupported_create_kwargs(
+    kwargs: cabc.Mapping[str, object],
+) -> typ.NoReturn:
+    """Raise ``TypeError`` naming task-creation kwargs outside the supported set."""
+    unexpected_keys = set(kwargs) - _TASK_CREATE_KWARGS_KEYS
+    keys = ", ".join(sorted(unexpected_keys, key=repr))
+    msg = f"Unsupported task creation kwargs: {keys}"
+    raise TypeError(msg)
 
 
 def _validate_task_metadata(
     metadata: TaskMetadata,
 ) -> TaskMetadata | None:
     """Validate metadata shape and return a narrowed typed payload."""
-    unsupported_keys = set(metadata) - _TASK_METADATA_KEYS
-    if unsupported_keys:
-        keys = ", ".join(repr(key) for key in sorted(unsupported_keys, key=repr))
-        msg = f"Unsupported task metadata keys: {keys}"
-        raise ValueError(msg)
-
-    validated: TaskMetadata = {}
-    operation_name = _validate_string_metadata_field(metadata, "operation_name")
-    if operation_name is not None:
-        validated["operation_name"] = operation_name
-
-    correlation_id = _validate_string_metadata_field(metadata, "correlation_id")
-    if correlation_id is not None:
-        validated["correlation_id"] = correlation_id
-
-    priority_hint = _validate_priority_hint_field(metadata)
-    if priority_hint is not None:
-        validated["priority_hint"] = priority_hint
-
-    return validated or None
+    # The subset test on the keys view allocates nothing when every key is
+    # supported; the set difference is only built to report a mismatch.
+    if not metadata.keys() <= _TASK_METADATA_KEYS:
+        _raise_unsupported_metadata_keys(metadata)
+
+    # One pass over the supplied keys; absent and ``None`` fields are omitted.
+    validated: dict[str, object] = {}
+    for field_name, value in metadata.items():
+        if value is None:
+            continue
+        if field_name == "priority_hint":
+            if isinstance(value, bool) or not isinstance(value, int):
+                msg = "Task metadata 'priority_hint' must be an integer."
+                raise TypeError(msg)
+        elif not isinstance(value, str):
+            msg = (
+                f"Task metadata {field_name!r} must be a string, "
+                f"got {type(value).__name__!r}."
+            )
+            raise TypeError(msg)
+        elif not value:
+            msg = f"Task metadata {field_name!r} must be a non-empty string."
+            raise ValueError(msg)
+        validated[field_name] = value
+
+    return typ.cast("TaskMetadata", validated) or None
 
 
 def _validate_task_create_kwargs(
     kwargs: cabc.Mapping[str, object],
 ) -> TaskCreateKwargs:
-    """Validate accepted task-creation kwargs and return a typed payload."""
-    unexpected_keys = set(kwargs) - _TASK_CREATE_KWARGS_KEYS
-    if unexpected_keys:
-        keys = ", ".join(sorted(unexpected_keys, key=repr))
-        msg = f"Unsupported task creation kwargs: {keys}"
-        raise TypeError(msg)
-    return typ.cast("TaskCreateKwargs", dict(kwargs))
+    """Validate task-creation kwargs, including metadata, in one pass."""
+    if not kwargs.keys() <= _TASK_CREATE_KWARGS_KEYS:
+        _raise_unsupported_create_kwargs(kwargs)
+    task_kwargs = typ.cast("TaskCreateKwargs", dict(kwargs))
+    metadata = task_kwargs.get("metadata")
+    if metadata is not None:
+        task_kwargs["metadata"] = _validate_task_metadata(metadata)
+    return task_kwargs
 
 
 def _create_with_optional_metadata[T](
     *,
-    loop: asyncio.AbstractEventLoop,
     task_creator: cabc.Callable[..., asyncio.Task[T]],
     coro: cabc.Coroutine[object, object, T],
     task_kwargs: TaskCreateKwargs,
 ) -> asyncio.Task[T]:
-    """Create a task and forward metadata only when a task factory is present."""
-    name = task_kwargs.get("name")
-    context = task_kwargs.get("context")
-    eager_start = task_kwargs.get("eager_start")
-    validated_metadata = task_kwargs.get("metadata")
-
-    if validated_metadata is None or loop.get_task_factory() is None:
-        return task_creator(
-            coro,
-            name=name,
-            context=context,
-            eager_start=eager_start,
-        )
+    """Create a task and forward metadata only when a task factory is present.
+
+    Only the options the caller supplied are forwarded, so the creator's own
+    defaults apply to the rest. The running loop is only consulted for its
+    task factory when metadata is present.
+    """
+    # ``task_kwargs`` is the validator's private copy, so popping is safe.
+    validated_metadata = task_kwargs.pop("metadata", None)
+    if (
+        validated_metadata is None
+        or asyncio.get_running_loop().get_task_factory() is None
+    ):
+        return task_creator(coro, **task_kwargs)
 
     return task_creator(
         coro,
-        name=name,
-        context=context,
-        eager_start=eager_start,
+        **task_kwargs,
         **{TASK_METADATA_KWARG: validated_metadata},
     )
 
@@ -143,17 +134,16 @@ def create_task[T](
     **kwargs: typ.Unpack[TaskCreateKwargs],
 ) -> asyncio.Task[T]:
     """Create an asyncio task with optional task-factory metadata."""
+    if not kwargs:
+        # The common ``create_task(coro)`` shape has nothing to validate or
+        # forward, so hand it straight to the running loop.
+        return asyncio.get_running_loop().create_task(coro)
     task_kwargs = _validate_task_create_kwargs(kwargs)
-    metadata = task_kwargs.get("metadata")
-    if metadata is not None:
-        task_kwargs["metadata"] = _validate_task_metadata(metadata)
-    loop = asyncio.get_running_loop()
     loop_task_creator = typ.cast(
         "cabc.Callable[..., asyncio.Task[T]]",
-        loop.create_task,
+        asyncio.get_running_loop().create_task,
     )
     return _create_with_optional_metadata(
-        loop=loop,
         task_creator=loop_task_creator,
         coro=coro,
         task_kwargs=task_kwargs,
@@ -167,17 +157,14 @@ def create_task_in_group[T](
     **kwargs: typ.Unpack[TaskCreateKwargs],
 ) -> asyncio.Task[T]:
     """Create a task in `task_group` with optional task-factory metadata."""
+    if not kwargs:
+        return task_group.create_task(coro)
     task_kwargs = _validate_task_create_kwargs(kwargs)
-    metadata = task_kwargs.get("metadata")
-    if metadata is not None:
-        task_kwargs["metadata"] = _validate_task_metadata(metadata)
-    loop = asyncio.get_running_loop()
     group_task_creator = typ.cast(
         "cabc.Callable[..., asyncio.Task[T]]",
         task_group.create_task,
     )
     return _create_with_optional_metadata(
-        loop=loop,
         task_creator=group_task_creator,
         coro=coro,
         task_kwargs=task_kwargs,
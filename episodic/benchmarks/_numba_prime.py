@@ -0,0 +1,64 @@
+"""Optional Numba-compiled prime counter for the interpreter benchmark.
+
+Numba is not a project dependency. When it (or NumPy, which it requires) is
+missing, ``load_jit_count_primes`` returns ``None`` and the benchmark skips
+the JIT mode in the same way it skips the interpreter pool on runtimes
+without sub-interpreter support.
+"""
+
+from __future__ import annotations
+
+import importlib
+import typing as typ
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+    import types
+
+_LOWEST_PRIME = 2
+
+
+def _import_optional(name: str) -> types.ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        return None
+
+
+# Typed as ``Any`` because the modules are optional and untyped here.
+_numba: typ.Any = _import_optional("numba")
+_np: typ.Any = _import_optional("numpy")
+
+
+def _count_primes_sieve(limit: int) -> int:  # pragma: no cover - JIT compiled
+    """Count primes up to ``limit`` with loops Numba can compile."""
+    if limit < _LOWEST_PRIME:
+        return 0
+    sieve = _np.ones(limit + 1, dtype=_np.bool_)
+    sieve[0] = False
+    sieve[1] = False
+    factor = _LOWEST_PRIME
+    while factor * factor <= limit:
+        if sieve[factor]:
+            for multiple in range(factor * factor, limit + 1, factor):
+                sieve[multiple] = False
+        factor += 1
+    count = 0
+    for candidate in range(limit + 1):
+        if sieve[candidate]:
+            count += 1
+    return count
+
+
+def load_jit_count_primes() -> cabc.Callable[[int], int] | None:
+    """Return the Numba-compiled prime counter, or ``None`` when unavailable.
+
+    Compilation is lazy, so callers should invoke the result once before
+    timing it to keep JIT compile time out of the measurement.
+    """
+    if _numba is None or _np is None:
+        return None
+    return typ.cast(
+        "cabc.Callable[[int], int]",
+        _numba.njit(cache=True)(_count_primes_sieve),
+    )
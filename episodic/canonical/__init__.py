@@ -17,84 +17,154 @@ Use the exported service functions from application code:
 ... )
 """
 
-from .domain import (
-    ApprovalEvent,
-    ApprovalState,
-    CanonicalEpisode,
-    Checkpoint,
-    CheckpointAction,
-    CheckpointResponse,
-    CheckpointStatus,
-    EpisodeStatus,
-    EpisodeTemplate,
-    EpisodeTemplateHistoryEntry,
-    GenerationEvent,
-    GenerationRun,
-    GenerationRunStatus,
-    IngestionJob,
-    IngestionRequest,
-    IngestionStatus,
-    ReferenceBinding,
-    ReferenceBindingTargetKind,
-    ReferenceDocument,
-    ReferenceDocumentKind,
-    ReferenceDocumentLifecycleState,
-    ReferenceDocumentRevision,
-    SeriesProfile,
-    SeriesProfileHistoryEntry,
-    SourceDocument,
-    SourceDocumentInput,
-    TeiHeader,
-)
-from .entity_protocols import (
-    ApprovalEventRepository,
-    EpisodeRepository,
-    EpisodeTemplateRepository,
-    IngestionJobRepository,
-    SeriesProfileRepository,
-    SourceDocumentRepository,
-    TeiHeaderRepository,
-)
-from .history_protocols import (
-    EpisodeTemplateHistoryRepository,
-    SeriesProfileHistoryRepository,
-)
-from .ingestion import (
-    ConflictOutcome,
-    MultiSourceRequest,
-    NormalizedSource,
-    RawSourceInput,
-    WeightingResult,
-)
-from .ingestion_service import IngestionPipeline, ingest_multi_source
-from .profile_templates import (
-    EntityKind,
-    EntityNotFoundError,
-    RevisionConflictError,
-    create_episode_template,
-    create_series_profile,
-    get_entity_with_revision,
-    list_entities_with_revisions,
-    list_history,
-    update_episode_template,
-    update_series_profile,
-)
-from .reference_protocols import (
-    ReferenceBindingRepository,
-    ReferenceDocumentRepository,
-    ReferenceDocumentRevisionRepository,
-)
-from .unit_of_work_protocols import CanonicalUnitOfWork
+import importlib
+import typing as typ
 
-# isort: split
-# Intentional: avoids import cycle with .profile_templates.
-# Remove when circular dependency is resolved.
-from .briefs import (
-    build_series_brief,
-    build_series_brief_prompt,
-    build_series_guardrail_prompt,
-)
-from .services import ingest_sources
+if typ.TYPE_CHECKING:
+    from .domain import (
+        ApprovalEvent,
+        ApprovalState,
+        CanonicalEpisode,
+        Checkpoint,
+        CheckpointAction,
+        CheckpointResponse,
+        CheckpointStatus,
+        EpisodeStatus,
+        EpisodeTemplate,
+        EpisodeTemplateHistoryEntry,
+        GenerationEvent,
+        GenerationRun,
+        GenerationRunStatus,
+        IngestionJob,
+        IngestionRequest,
+        IngestionStatus,
+        ReferenceBinding,
+        ReferenceBindingTargetKind,
+        ReferenceDocument,
+        ReferenceDocumentKind,
+        ReferenceDocumentLifecycleState,
+        ReferenceDocumentRevision,
+        SeriesProfile,
+        SeriesProfileHistoryEntry,
+        SourceDocument,
+        SourceDocumentInput,
+        TeiHeader,
+    )
+    from .entity_protocols import (
+        ApprovalEventRepository,
+        EpisodeRepository,
+        EpisodeTemplateRepository,
+        IngestionJobRepository,
+        SeriesProfileRepository,
+        SourceDocumentRepository,
+        TeiHeaderRepository,
+    )
+    from .history_protocols import (
+        EpisodeTemplateHistoryRepository,
+        SeriesProfileHistoryRepository,
+    )
+    from .ingestion import (
+        ConflictOutcome,
+        MultiSourceRequest,
+        NormalizedSource,
+        RawSourceInput,
+        WeightingResult,
+    )
+    from .ingestion_service import IngestionPipeline, ingest_multi_source
+    from .profile_templates import (
+        EntityKind,
+        EntityNotFoundError,
+        RevisionConflictError,
+        create_episode_template,
+        create_series_profile,
+        get_entity_with_revision,
+        list_entities_with_revisions,
+        list_history,
+        update_episode_template,
+        update_series_profile,
+    )
+    from .reference_protocols import (
+        ReferenceBindingRepository,
+        ReferenceDocumentRepository,
+        ReferenceDocumentRevisionRepository,
+    )
+    from .unit_of_work_protocols import CanonicalUnitOfWork
+
+    # isort: split
+    from .briefs import (
+        build_series_brief,
+        build_series_brief_prompt,
+        build_series_guardrail_prompt,
+    )
+    from .services import ingest_sources
+
+# Exports resolve on first attribute access (PEP 562), so importing one
+# submodule such as ``episodic.canonical.domain`` does not pull in the
+# ingestion pipeline, briefs, and services. This also breaks the import
+# cycle between ``.briefs`` and ``.profile_templates`` at package load.
+_LAZY_EXPORTS: dict[str, str] = {
+    "ApprovalEvent": ".domain",
+    "ApprovalEventRepository": ".entity_protocols",
+    "ApprovalState": ".domain",
+    "CanonicalEpisode": ".domain",
+    "CanonicalUnitOfWork": ".unit_of_work_protocols",
+    "Checkpoint": ".domain",
+    "CheckpointAction": ".domain",
+    "CheckpointResponse": ".domain",
+    "CheckpointStatus": ".domain",
+    "ConflictOutcome": ".ingestion",
+    "EntityKind": ".profile_templates",
+    "EntityNotFoundError": ".profile_templates",
+    "EpisodeRepository": ".entity_protocols",
+    "EpisodeStatus": ".domain",
+    "EpisodeTemplate": ".domain",
+    "EpisodeTemplateHistoryEntry": ".domain",
+    "EpisodeTemplateHistoryRepository": ".history_protocols",
+    "EpisodeTemplateRepository": ".entity_protocols",
+    "GenerationEvent": ".domain",
+    "GenerationRun": ".domain",
+    "GenerationRunStatus": ".domain",
+    "IngestionJob": ".domain",
+    "IngestionJobRepository": ".entity_protocols",
+    "IngestionPipeline": ".ingestion_service",
+    "IngestionRequest": ".domain",
+    "IngestionStatus": ".domain",
+    "MultiSourceRequest": ".ingestion",
+    "NormalizedSource": ".ingestion",
+    "RawSourceInput": ".ingestion",
+    "ReferenceBinding": ".domain",
+    "ReferenceBindingRepository": ".reference_protocols",
+    "ReferenceBindingTargetKind": ".domain",
+    "ReferenceDocument": ".domain",
+    "ReferenceDocumentKind": ".domain",
+    "ReferenceDocumentLifecycleState": ".domain",
+    "ReferenceDocumentRepository": ".reference_protocols",
+    "ReferenceDocumentRevision": ".domain",
+    "ReferenceDocumentRevisionRepository": ".reference_protocols",
+    "RevisionConflictError": ".profile_templates",
+    "SeriesProfile": ".domain",
+    "SeriesProfileHistoryEntry": ".domain",
+    "SeriesProfileHistoryRepository": ".history_protocols",
+    "SeriesProfileRepository": ".entity_protocols",
+    "SourceDocument": ".domain",
+    "SourceDocumentInput": ".domain",
+    "SourceDocumentRepository": ".entity_protocols",
+    "TeiHeader": ".domain",
+    "TeiHeaderRepository": ".entity_protocols",
+    "WeightingResult": ".ingestion",
+    "build_series_brief": ".briefs",
+    "build_series_brief_prompt": ".briefs",
+    "build_series_guardrail_prompt": ".briefs",
+    "create_episode_template": ".profile_templates",
+    "create_series_profile": ".profile_templates",
+    "get_entity_with_revision": ".profile_templates",
+    "ingest_multi_source": ".ingestion_service",
+    "ingest_sources": ".services",
+    "list_entities_with_revisions": ".profile_templates",
+    "list_history": ".profile_templates",
+    "update_episode_template": ".profile_templates",
+    "update_series_profile": ".profile_templates",
+}
 
 __all__: list[str] = [
     "ApprovalEvent",
@@ -159,3 +229,19 @@ __all__: list[str] = [
     "update_episode_template",
     "update_series_profile",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import and cache a public export on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public exports alongside the module's loaded globals."""
+    return sorted({*globals(), *__all__})
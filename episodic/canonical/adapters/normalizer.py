@@ -15,6 +15,9 @@ Normalize a transcript source:
 """
 
 import dataclasses as dc
+import functools
+import re
+import types
 import typing as typ
 
 import tei_rapporteur as _tei
@@ -24,6 +27,8 @@ from episodic.canonical.domain import SourceDocumentInput
 from episodic.canonical.ingestion import NormalizedSource, RawSourceInput
 
 if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
     from episodic.canonical.domain import JsonMapping
 
 
@@ -37,41 +42,62 @@ class _SourceTypeScores:
 
 
 #: Default score profiles for known source types.
-_DEFAULT_SCORES: dict[str, _SourceTypeScores] = {
+#: Read-only so normalizers without overrides can share it directly.
+_DEFAULT_SCORES: cabc.Mapping[str, _SourceTypeScores] = types.MappingProxyType({
     "transcript": _SourceTypeScores(quality=0.9, freshness=0.8, reliability=0.9),
     "brief": _SourceTypeScores(quality=0.8, freshness=0.7, reliability=0.8),
     "rss": _SourceTypeScores(quality=0.6, freshness=1.0, reliability=0.5),
     "press_release": _SourceTypeScores(quality=0.7, freshness=0.6, reliability=0.7),
     "research_notes": _SourceTypeScores(quality=0.5, freshness=0.5, reliability=0.6),
-}
+})
 
 #: Fallback scores for unrecognized source types.
 _FALLBACK_SCORES = _SourceTypeScores(quality=0.5, freshness=0.5, reliability=0.5)
 
+#: First non-whitespace character up to the next ``str.splitlines`` boundary.
+_FIRST_CONTENT_LINE = re.compile(r"\S[^\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]*")
+
+#: Longest title inferred from content, and longest title whose TEI fragment
+#: is cached; longer caller-supplied titles are rendered without caching.
+_MAX_TITLE_LENGTH = 120
+
 
 def _infer_title(raw_source: RawSourceInput) -> str:
     """Infer a title from raw source content or metadata."""
     title = raw_source.metadata.get("title")
     if isinstance(title, str) and title.strip():
         return title.strip()
-    # Fall back to the first non-blank line of content.
-    for line in raw_source.content.splitlines():
-        stripped = line.strip()
-        if stripped:
-            return stripped[:120]
+    # Fall back to the first non-blank line of content. The regex stops at
+    # that line instead of splitting the whole (possibly large) body.
+    first_line = _FIRST_CONTENT_LINE.search(raw_source.content)
+    if first_line is not None:
+        return first_line.group().rstrip()[:_MAX_TITLE_LENGTH]
     return raw_source.source_type.replace("_", " ").title()
 
 
+def _emit_tei_xml(title: str) -> str:
+    """Emit a TEI document containing only ``title``."""
+    document = _tei.Document(title)
+    return _tei.emit_xml(document)
+
+
+_cached_tei_xml = functools.lru_cache(maxsize=1024)(_emit_tei_xml)
+
+
 def _build_tei_xml(title: str) -> str:
     """Build minimal valid TEI XML from a title.
 
     This is a placeholder implementation that constructs a TEI document
     containing only the title.  Raw source content is **not** embedded in
     the fragment; a production normalizer should parse or transform the
-    content into TEI body elements.
+    content into TEI body elements. The fragment depends only on ``title``,
+    so fragments for titles up to ``_MAX_TITLE_LENGTH`` characters are
+    cached for bulk ingestion. Longer metadata titles are caller-controlled
+    and are rendered uncached so the cache cannot pin large strings.
     """
-    document = _tei.Document(title)
-    return _tei.emit_xml(document)
+    if len(title) > _MAX_TITLE_LENGTH:
+        return _emit_tei_xml(title)
+    return _cached_tei_xml(title)
 
 
 def _build_source_document_input(
@@ -107,14 +133,17 @@ class InMemorySourceNormalizer:
         self,
         score_overrides: dict[str, JsonMapping] | None = None,
     ) -> None:
-        self._scores = dict(_DEFAULT_SCORES)
-        if score_overrides:
-            for source_type, overrides in score_overrides.items():
-                self._scores[source_type] = _SourceTypeScores(
-                    quality=coerce_float(overrides.get("quality"), 0.5),
-                    freshness=coerce_float(overrides.get("freshness"), 0.5),
-                    reliability=coerce_float(overrides.get("reliability"), 0.5),
-                )
+        if not score_overrides:
+            self._scores = _DEFAULT_SCORES
+            return
+        scores = dict(_DEFAULT_SCORES)
+        for source_type, overrides in score_overrides.items():
+            scores[source_type] = _SourceTypeScores(
+                quality=coerce_float(overrides.get("quality"), 0.5),
+                freshness=coerce_float(overrides.get("freshness"), 0.5),
+                reliability=coerce_float(overrides.get("reliability"), 0.5),
+            )
+        self._scores = scores
 
     async def normalize(
         self,
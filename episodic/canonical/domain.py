@@ -279,7 +279,7 @@ class Checkpoint:
             raise CheckpointAlreadyTerminal(self.id)
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class SeriesProfile:
     """Series metadata required for canonical ingestion."""
 
@@ -12,6 +12,7 @@ Examples
 
 from .brief import build_series_brief
 from .services import (
+    count_history,
     create_episode_template,
     create_series_profile,
     get_entity_with_revision,
@@ -55,6 +56,7 @@ __all__: list[str] = [
     "UpdateEpisodeTemplateRequest",
     "UpdateSeriesProfileRequest",
     "build_series_brief",
+    "count_history",
     "create_episode_template",
     "create_series_profile",
     "get_entity_with_revision",
@@ -12,6 +12,7 @@ Examples
 """
 
 from ._generic import (
+    count_history,
     get_entity_with_revision,
     list_entities_with_revisions,
     list_entities_with_revisions_paged,
@@ -32,6 +33,7 @@ from ._typed import (
 )
 
 __all__: tuple[str, ...] = (
+    "count_history",
     "create_episode_template",
     "create_series_profile",
     "get_entity_with_revision",
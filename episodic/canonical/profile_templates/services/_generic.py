@@ -286,6 +286,21 @@ async def list_history_paged(
     return items, total
 
 
+async def count_history(
+    uow: CanonicalUnitOfWork,
+    *,
+    parent_id: uuid.UUID,
+    kind: EntityKind | str,
+) -> int:
+    """Count history entries for one parent entity.
+
+    History is append-only, so the count changes exactly when a new entry is
+    recorded and can tag history pages without loading them.
+    """
+    dispatch = _get_repos_for_kind(uow, kind)
+    return await dispatch.count_history_for_parent(parent_id)
+
+
 async def list_entities_with_revisions(
     uow: CanonicalUnitOfWork,
     *,
@@ -13,6 +13,7 @@ Commit work in a single unit-of-work:
 """
 
 import typing as typ
+from functools import cached_property
 
 from episodic.canonical.unit_of_work_protocols import CanonicalUnitOfWork
 from episodic.logging import get_logger
@@ -50,7 +51,7 @@ if typ.TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-class SqlAlchemyUnitOfWork(CanonicalUnitOfWork):
+class SqlAlchemyUnitOfWork(CanonicalUnitOfWork):  # noqa: PLR0904  # one lazy property per repository port
     """Async unit-of-work backed by SQLAlchemy sessions.
 
     Parameters
@@ -90,6 +91,10 @@ class SqlAlchemyUnitOfWork(CanonicalUnitOfWork):
         Repository for immutable reusable reference document revisions.
     reference_bindings : SqlAlchemyReferenceBindingRepository
         Repository for reusable reference binding persistence.
+
+    Repositories are created on first access within each ``async with``
+    block, so a request that touches one repository does not pay for the
+    others.
     """
 
     def __init__(
@@ -112,42 +117,12 @@ class SqlAlchemyUnitOfWork(CanonicalUnitOfWork):
         SqlAlchemyUnitOfWork
             The active unit-of-work instance.
         """
+        # Repositories are built on first access, so clear any cached for a
+        # previous session before handing out the new one.
+        instance_state = vars(self)
+        for name in _SESSION_REPOSITORIES:
+            instance_state.pop(name, None)
         self._session = self._session_factory()
-        self.series_profiles = SqlAlchemySeriesProfileRepository(self._session)
-        self.tei_headers = SqlAlchemyTeiHeaderRepository(self._session)
-        self.episodes = SqlAlchemyEpisodeRepository(self._session)
-        self.ingestion_jobs = SqlAlchemyIngestionJobRepository(self._session)
-        self.source_documents = SqlAlchemySourceDocumentRepository(self._session)
-        self.approval_events = SqlAlchemyApprovalEventRepository(self._session)
-        self.episode_templates = SqlAlchemyEpisodeTemplateRepository(self._session)
-        self.series_profile_history = SqlAlchemySeriesProfileHistoryRepository(
-            self._session
-        )
-        self.episode_template_history = SqlAlchemyEpisodeTemplateHistoryRepository(
-            self._session
-        )
-        self.reference_documents = SqlAlchemyReferenceDocumentRepository(self._session)
-        self.reference_document_revisions = (
-            SqlAlchemyReferenceDocumentRevisionRepository(self._session)
-        )
-        self.reference_bindings = SqlAlchemyReferenceBindingRepository(self._session)
-        self.uploads = SqlAlchemyUploadRepository(self._session)
-        self.ingestion_job_sources = SqlAlchemyIngestionJobSourceRepository(
-            self._session
-        )
-        self.idempotency = SqlAlchemyIdempotencyStore(
-            self._session,
-            runtime=source_intake_storage_runtime(
-                None,
-                metrics=self._metrics,
-                monotonic_clock=self._clock,
-            ),
-        )
-        self.workflow_checkpoints = SqlAlchemyWorkflowCheckpointStore(
-            self._session,
-            metrics=self._metrics,
-            clock=self._clock,
-        )
         return self
 
     async def __aexit__(
@@ -179,6 +154,99 @@ class SqlAlchemyUnitOfWork(CanonicalUnitOfWork):
         finally:
             await self._session.close()
 
+    @cached_property
+    def series_profiles(self) -> SqlAlchemySeriesProfileRepository:
+        """Repository for series profile persistence."""
+        return SqlAlchemySeriesProfileRepository(self._require_session())
+
+    @cached_property
+    def tei_headers(self) -> SqlAlchemyTeiHeaderRepository:
+        """Repository for TEI header persistence."""
+        return SqlAlchemyTeiHeaderRepository(self._require_session())
+
+    @cached_property
+    def episodes(self) -> SqlAlchemyEpisodeRepository:
+        """Repository for canonical episode persistence."""
+        return SqlAlchemyEpisodeRepository(self._require_session())
+
+    @cached_property
+    def ingestion_jobs(self) -> SqlAlchemyIngestionJobRepository:
+        """Repository for ingestion job persistence."""
+        return SqlAlchemyIngestionJobRepository(self._require_session())
+
+    @cached_property
+    def source_documents(self) -> SqlAlchemySourceDocumentRepository:
+        """Repository for source document persistence."""
+        return SqlAlchemySourceDocumentRepository(self._require_session())
+
+    @cached_property
+    def approval_events(self) -> SqlAlchemyApprovalEventRepository:
+        """Repository for approval event persistence."""
+        return SqlAlchemyApprovalEventRepository(self._require_session())
+
+    @cached_property
+    def episode_templates(self) -> SqlAlchemyEpisodeTemplateRepository:
+        """Repository for episode template persistence."""
+        return SqlAlchemyEpisodeTemplateRepository(self._require_session())
+
+    @cached_property
+    def series_profile_history(self) -> SqlAlchemySeriesProfileHistoryRepository:
+        """Repository for series profile change history."""
+        return SqlAlchemySeriesProfileHistoryRepository(self._require_session())
+
+    @cached_property
+    def episode_template_history(self) -> SqlAlchemyEpisodeTemplateHistoryRepository:
+        """Repository for episode template change history."""
+        return SqlAlchemyEpisodeTemplateHistoryRepository(self._require_session())
+
+    @cached_property
+    def reference_documents(self) -> SqlAlchemyReferenceDocumentRepository:
+        """Repository for reusable reference document persistence."""
+        return SqlAlchemyReferenceDocumentRepository(self._require_session())
+
+    @cached_property
+    def reference_document_revisions(
+        self,
+    ) -> SqlAlchemyReferenceDocumentRevisionRepository:
+        """Repository for immutable reference document revisions."""
+        return SqlAlchemyReferenceDocumentRevisionRepository(self._require_session())
+
+    @cached_property
+    def reference_bindings(self) -> SqlAlchemyReferenceBindingRepository:
+        """Repository for reusable reference binding persistence."""
+        return SqlAlchemyReferenceBindingRepository(self._require_session())
+
+    @cached_property
+    def uploads(self) -> SqlAlchemyUploadRepository:
+        """Repository for upload persistence."""
+        return SqlAlchemyUploadRepository(self._require_session())
+
+    @cached_property
+    def ingestion_job_sources(self) -> SqlAlchemyIngestionJobSourceRepository:
+        """Repository for ingestion job source persistence."""
+        return SqlAlchemyIngestionJobSourceRepository(self._require_session())
+
+    @cached_property
+    def idempotency(self) -> SqlAlchemyIdempotencyStore:
+        """Idempotency store for source-intake writes."""
+        return SqlAlchemyIdempotencyStore(
+            self._require_session(),
+            runtime=source_intake_storage_runtime(
+                None,
+                metrics=self._metrics,
+                monotonic_clock=self._clock,
+            ),
+        )
+
+    @cached_property
+    def workflow_checkpoints(self) -> SqlAlchemyWorkflowCheckpointStore:
+        """Checkpoint store for generation workflows."""
+        return SqlAlchemyWorkflowCheckpointStore(
+            self._require_session(),
+            metrics=self._metrics,
+            clock=self._clock,
+        )
+
     def _require_session(self) -> AsyncSession:
         """Return the active session or raise when missing."""
         if self._session is None:
@@ -214,3 +282,11 @@ class SqlAlchemyUnitOfWork(CanonicalUnitOfWork):
         """Roll back the current unit-of-work session."""
         session = self._require_session()
         await session.rollback()
+
+
+# Repository attributes built lazily per session; ``__aenter__`` drops them.
+_SESSION_REPOSITORIES = tuple(
+    name
+    for name, member in vars(SqlAlchemyUnitOfWork).items()
+    if isinstance(member, cached_property)
+)
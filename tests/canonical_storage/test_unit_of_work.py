@@ -79,3 +79,34 @@ async def test_uow_rolls_back_on_exception(session_factory: object) -> None:
         result = await uow.series_profiles.get(profile.id)
 
     assert result is None, "Expected exception to trigger rollback."
+
+
+class _ClosableSession:
+    """Minimal session stand-in that supports the UoW exit protocol."""
+
+    async def close(self) -> None:
+        """Accept the close issued by ``__aexit__``."""
+
+    async def rollback(self) -> None:
+        """Accept the rollback issued on exceptional exit."""
+
+
+@pytest.mark.asyncio
+async def test_uow_builds_repositories_lazily_per_session() -> None:
+    """Repositories are built on first access and rebuilt for each session."""
+    factory = typ.cast("async_sessionmaker[AsyncSession]", _ClosableSession)
+    uow = SqlAlchemyUnitOfWork(factory)
+
+    async with uow:
+        assert "series_profiles" not in vars(uow), (
+            "Expected repositories to be built only when first accessed."
+        )
+        first = uow.series_profiles
+        assert uow.series_profiles is first, (
+            "Expected repeated access to reuse the session's repository."
+        )
+
+    async with uow:
+        assert uow.series_profiles is not first, (
+            "Expected a re-entered unit of work to rebuild its repositories."
+        )
@@ -141,63 +141,64 @@ class TestPayloadDataclass:
 
 
 class TestTypedUpdateRequest:
-    """Tests for typed update-request composition helper behavior."""
+    """Tests for typed update-request assembly in the update builders."""
 
     @staticmethod
-    def test_build_typed_update_request_passes_payload_and_uses_data_builder(
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        """Pass payload through and use parsed components from data_builder."""
-        captured: dict[str, object] = {}
+    def test_build_profile_update_request_assembles_parsed_components() -> None:
+        """Build a profile update request from the parsed payload components."""
         entity_id = uuid.uuid4()
 
-        def sentinel_data_builder(payload: dict[str, object]) -> str:
-            return typ.cast("str", payload["title"])
-
-        def fake_build_update_kwargs(
-            payload: dict[str, object],
-            *,
-            data_builder: cabc.Callable[[dict[str, object]], str],
-        ) -> helpers._ParsedUpdatePayload[str]:
-            captured["payload"] = payload
-            captured["data_builder"] = data_builder
-            return helpers._ParsedUpdatePayload(
-                expected_revision=3,
-                data="payload-fields",
-                audit=AuditMetadata(actor="editor@example.com", note="update"),
-            )
+        request = helpers.build_profile_update_request(
+            entity_id,
+            {
+                "expected_revision": 3,
+                "title": "Updated",
+                "configuration": {"tone": "precise"},
+                "actor": "editor@example.com",
+                "note": "update",
+            },
+        )
 
-        monkeypatch.setattr(
-            helpers,
-            "_build_update_kwargs",
-            fake_build_update_kwargs,
+        assert request.profile_id == entity_id, (
+            "Expected the update request to target the given profile."
+        )
+        assert request.expected_revision == 3, (
+            "Expected the parsed expected_revision on the update request."
         )
+        assert request.data.title == "Updated", (
+            "Expected profile fields to be built from the payload."
+        )
+        assert request.audit == AuditMetadata(
+            actor="editor@example.com",
+            note="update",
+        ), "Expected audit metadata to be built from the payload."
+
+    @staticmethod
+    def test_build_template_update_request_assembles_parsed_components() -> None:
+        """Build a template update request from the parsed payload components."""
+        entity_id = uuid.uuid4()
 
-        request = helpers._build_typed_update_request(
+        request = helpers.build_template_update_request(
             entity_id,
-            {"title": "updated"},
-            data_builder=sentinel_data_builder,
-            request_builder=lambda eid, rev, fields, audit: {
-                "entity_id": eid,
-                "expected_revision": rev,
-                "fields": fields,
-                "audit": audit,
+            {
+                "expected_revision": "2",
+                "title": "Updated",
+                "structure": {"segments": ["intro"]},
             },
         )
 
-        assert captured["payload"] == {"title": "updated"}, (
-            "Expected helper to pass payload through to _build_update_kwargs."
+        assert request.template_id == entity_id, (
+            "Expected the update request to target the given template."
+        )
+        assert request.expected_revision == 2, (
+            "Expected string revisions to be coerced to integers."
+        )
+        assert request.data.structure == {"segments": ["intro"]}, (
+            "Expected template fields to be built from the payload."
         )
-        assert captured["data_builder"] is sentinel_data_builder, (
-            "Expected _build_typed_update_request to forward the same "
-            "data_builder callable to _build_update_kwargs."
+        assert request.audit == AuditMetadata(actor=None, note=None), (
+            "Expected absent audit fields to default to None."
         )
-        assert request == {
-            "entity_id": entity_id,
-            "expected_revision": 3,
-            "fields": "payload-fields",
-            "audit": AuditMetadata(actor="editor@example.com", note="update"),
-        }, "Expected request builder output to use parsed update components."
 
 
 class TestGuardrailValidation:
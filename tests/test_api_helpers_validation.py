@@ -0,0 +1,219 @@
+"""Unit tests for request validation helpers in ``episodic.api.helpers``.
+
+These tests cover UUID parsing, optimistic-lock revision parsing, required-field
+reporting, and audit metadata extraction used by Falcon resource adapters.
+
+Run these tests directly with:
+
+```bash
+python -m pytest -v tests/test_api_helpers_validation.py
+```
+"""
+
+import typing as typ
+import uuid
+from functools import partial
+
+import falcon
+import pytest
+
+from episodic.api import helpers
+from episodic.canonical.profile_templates import AuditMetadata
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from episodic.api.types import JsonPayload
+
+
+class TestParseUuid:
+    """Tests for UUID parsing across canonical and legacy input forms."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "template",
+        [
+            pytest.param("{value}", id="canonical"),
+            pytest.param("{{{value}}}", id="braced"),
+            pytest.param("urn:uuid:{value}", id="urn"),
+        ],
+    )
+    def test_parse_uuid_accepts_supported_forms(template: str) -> None:
+        """Parse canonical and other ``uuid.UUID``-supported spellings."""
+        expected = uuid.uuid4()
+
+        parsed = helpers.parse_uuid(template.format(value=expected), "profile_id")
+
+        assert parsed == expected, "Expected the UUID value to round-trip."
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "raw_value",
+        [
+            pytest.param("z" * 36, id="canonical-length-non-hex"),
+            pytest.param("not-a-uuid", id="short"),
+        ],
+    )
+    def test_parse_uuid_rejects_invalid_values(raw_value: str) -> None:
+        """Raise HTTP 400 with the field name for unparseable values."""
+        with pytest.raises(falcon.HTTPBadRequest) as exc_info:
+            helpers.parse_uuid(raw_value, "profile_id")
+
+        assert exc_info.value.description == (
+            f"Invalid UUID for profile_id: {raw_value!r}."
+        ), "Expected invalid UUIDs to report the offending field and value."
+
+    @staticmethod
+    def test_parse_uuid_truncates_oversized_values_in_errors() -> None:
+        """Bound the echoed value for oversized invalid input."""
+        raw_value = "x" * 10_000
+
+        with pytest.raises(falcon.HTTPBadRequest) as exc_info:
+            helpers.parse_uuid(raw_value, "profile_id")
+
+        description = typ.cast("str", exc_info.value.description)
+        assert description.startswith("Invalid UUID for profile_id: 'xxx"), (
+            "Expected the error to name the field and echo a value prefix."
+        )
+        assert len(description) < 200, (
+            "Expected oversized values to be truncated in the error message."
+        )
+
+
+class TestParseExpectedRevision:
+    """Tests for optimistic-lock revision parsing."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("raw_value", "expected"),
+        [
+            pytest.param(4, 4, id="int"),
+            pytest.param("7", 7, id="digit-string"),
+            pytest.param(" +2 ", 2, id="signed-padded-string"),
+        ],
+    )
+    def test_parse_expected_revision_accepts_positive_integers(
+        raw_value: object,
+        expected: int,
+    ) -> None:
+        """Accept positive integers and their plain decimal spellings."""
+        assert helpers.parse_expected_revision({"expected_revision": raw_value}) == (
+            expected
+        ), "Expected the revision to parse as a positive integer."
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "raw_value",
+        [
+            pytest.param(True, id="bool"),
+            pytest.param(0, id="zero"),
+            pytest.param("-1", id="negative-string"),
+            pytest.param("1_000", id="underscore-separator"),
+            pytest.param("1.0", id="decimal-point"),
+            pytest.param("", id="empty"),
+            pytest.param("+", id="sign-only"),
+        ],
+    )
+    def test_parse_expected_revision_rejects_invalid_values(
+        raw_value: object,
+    ) -> None:
+        """Reject values that are not strictly positive plain integers."""
+        with pytest.raises(falcon.HTTPBadRequest) as exc_info:
+            helpers.parse_expected_revision({"expected_revision": raw_value})
+
+        assert exc_info.value.description == (
+            f"Invalid integer for expected_revision: {raw_value!r}."
+        ), "Expected invalid revisions to report the offending value."
+
+
+class TestCreateKwargsRequiredFields:
+    """Tests for required-field reporting in create and update builders."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("builder", "payload", "description"),
+        [
+            pytest.param(
+                helpers.build_profile_create_kwargs,
+                {"slug": "profile", "title": "Profile"},
+                "Missing required field: configuration",
+                id="profile-create-one-missing",
+            ),
+            pytest.param(
+                helpers.build_profile_create_kwargs,
+                {"title": "Profile"},
+                "Missing required fields: slug, configuration",
+                id="profile-create-several-missing",
+            ),
+            pytest.param(
+                helpers.build_template_create_kwargs,
+                {
+                    "series_profile_id": str(uuid.uuid4()),
+                    "slug": "template",
+                    "structure": {},
+                },
+                "Missing required field: title",
+                id="template-create-one-missing",
+            ),
+            pytest.param(
+                partial(helpers.build_template_update_request, uuid.uuid4()),
+                {"expected_revision": 1},
+                "Missing required fields: title, structure",
+                id="template-update-several-missing",
+            ),
+        ],
+    )
+    def test_builders_report_missing_required_fields(
+        builder: cabc.Callable[..., object],
+        payload: JsonPayload,
+        description: str,
+    ) -> None:
+        """Report every missing required key, in declaration order."""
+        with pytest.raises(falcon.HTTPBadRequest) as exc_info:
+            _ = builder(payload)
+
+        assert exc_info.value.description == description, (
+            "Expected missing required keys to be reported together."
+        )
+
+    @staticmethod
+    def test_require_payload_fields_reports_every_missing_key() -> None:
+        """Handler-level checks should match the builders' reporting."""
+        helpers.require_payload_fields(
+            {"expected_revision": 1, "title": "Profile", "configuration": {}},
+            ("expected_revision", "title", "configuration"),
+        )
+
+        with pytest.raises(falcon.HTTPBadRequest) as exc_info:
+            helpers.require_payload_fields(
+                {"title": "Profile"},
+                ("expected_revision", "title", "configuration"),
+            )
+
+        assert exc_info.value.description == (
+            "Missing required fields: expected_revision, configuration"
+        ), "Expected every missing key to be reported in declaration order."
+
+
+class TestBuildAuditMetadata:
+    """Tests for audit metadata extraction from write payloads."""
+
+    @staticmethod
+    def test_build_audit_metadata_shares_empty_instance() -> None:
+        """Reuse one frozen instance when no audit fields are supplied."""
+        first = helpers.build_audit_metadata({})
+        second = helpers.build_audit_metadata({"actor": None})
+
+        assert first == AuditMetadata(actor=None, note=None), (
+            "Expected absent audit fields to default to None."
+        )
+        assert first is second, "Expected anonymous writes to share one instance."
+
+    @staticmethod
+    def test_build_audit_metadata_reads_supplied_fields() -> None:
+        """Build a fresh instance when either audit field is supplied."""
+        audit = helpers.build_audit_metadata({"note": "edited"})
+
+        assert audit == AuditMetadata(actor=None, note="edited"), (
+            "Expected supplied audit fields to be preserved."
+        )
@@ -0,0 +1,39 @@
+"""Unit tests for the shared Falcon resource bases.
+
+These tests cover the class-creation checks in
+``episodic.api.resources.base`` that replace the old abstract marker hook.
+
+Run these tests directly with:
+
+```bash
+python -m pytest -v tests/test_api_resource_base.py
+```
+"""
+
+import pytest
+
+from episodic.api.resources import base
+
+
+def test_public_resource_must_bind_every_hook() -> None:
+    """Concrete resources missing a base hook should fail at class creation."""
+    with pytest.raises(TypeError, match="_serializer_fn") as exc_info:
+
+        class IncompleteResource(base._GetResourceBase):
+            _id_field_name = "entity_id"
+            _service_fn = staticmethod(lambda **_: None)
+
+    assert "_id_field_name" not in str(exc_info.value), (
+        "Expected bound hooks to be omitted from the missing-hook error."
+    )
+
+
+def test_private_intermediate_bases_skip_hook_check() -> None:
+    """Underscore-prefixed bases may leave hooks for their subclasses."""
+
+    class _PartialResource(base._GetResourceBase):
+        _id_field_name = "entity_id"
+
+    assert _PartialResource._hook_names == base._GetResourceBase._hook_names, (
+        "Expected private bases to inherit the hook names unchanged."
+    )
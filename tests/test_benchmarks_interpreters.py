@@ -0,0 +1,74 @@
+"""Unit tests for the interpreter benchmark workload and timing loop."""
+
+from __future__ import annotations
+
+import pytest
+
+from episodic.benchmarks import _numba_prime
+from episodic.benchmarks import interpreters as bench
+from episodic.concurrent_interpreters import InlineCpuTaskExecutor
+
+
+@pytest.mark.parametrize(
+    ("upper_bound", "expected"),
+    [
+        pytest.param(-1, 0, id="negative"),
+        pytest.param(0, 0, id="zero"),
+        pytest.param(1, 0, id="one"),
+        pytest.param(2, 1, id="lowest-prime"),
+        pytest.param(10, 4, id="ten"),
+        pytest.param(100, 25, id="hundred"),
+        pytest.param(25_000, 2762, id="previous-default-bound"),
+    ],
+)
+def test_count_primes_matches_known_prime_counts(
+    upper_bound: int,
+    expected: int,
+) -> None:
+    """The sieve should count primes up to and including the bound."""
+    result = bench.count_primes(bench.PrimeTask(upper_bound=upper_bound))
+
+    assert result == expected, (
+        f"Expected {expected} primes up to {upper_bound}, got {result}."
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark_uses_custom_task_fn() -> None:
+    """The timing loop should run the supplied task function for every repeat."""
+    calls: list[int] = []
+
+    def doubled_bound(task: bench.PrimeTask) -> int:
+        calls.append(task.upper_bound)
+        return task.upper_bound * 2
+
+    tasks = (bench.PrimeTask(upper_bound=3), bench.PrimeTask(upper_bound=5))
+
+    result, outputs = await bench._run_benchmark(
+        label="custom",
+        executor=InlineCpuTaskExecutor(),
+        tasks=tasks,
+        repeats=2,
+        task_fn=doubled_bound,
+    )
+
+    assert outputs == (6, 10), "Expected outputs from the custom task function."
+    assert calls == [3, 3, 5, 3, 5], (
+        "Expected one untimed warm-up task followed by every task per repeat."
+    )
+    assert (result.label, result.task_count, len(result.durations_ns)) == (
+        "custom",
+        2,
+        2,
+    ), "Expected one recorded duration per repeat for the labelled run."
+
+
+def test_load_jit_count_primes_returns_none_without_numba(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The JIT mode should be skipped when Numba is not importable."""
+    monkeypatch.setattr(_numba_prime, "_numba", None)
+
+    assert _numba_prime.load_jit_count_primes() is None, (
+        "Expected no JIT prime counter when Numba is unavailable."
+    )
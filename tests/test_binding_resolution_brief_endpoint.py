@@ -51,3 +51,26 @@ def test_brief_endpoint_returns_404_for_invalid_episode(
         params={"episode_id": nonexistent_episode_id},
     )
     assert response.status_code == 404, "Expected 404 when episode_id does not exist."
+    body = typ.cast("dict[str, object]", response.json)
+    assert body["code"] == "not_found", "Expected the not_found error code."
+    assert body["details"] == {}, (
+        "Expected the app-level handler to keep the plain 404 body without details."
+    )
+
+
+def test_brief_endpoint_honours_if_none_match(
+    canonical_api_client: testing.TestClient,
+) -> None:
+    """Brief endpoint should answer a matching ETag with 304 and no body."""
+    fixture = reference_support.build_api_fixture(canonical_api_client)
+    path = f"/v1/series-profiles/{fixture.primary_profile_id}/brief"
+    first = canonical_api_client.simulate_get(path)
+    etag = first.headers.get("etag")
+    assert etag is not None, "Expected the brief response to include an ETag."
+
+    repeat = canonical_api_client.simulate_get(
+        path,
+        headers={"If-None-Match": etag},
+    )
+    assert repeat.status_code == 304, "Expected 304 for a matching If-None-Match."
+    assert not repeat.content, "Expected the 304 brief response to omit the body."
@@ -0,0 +1,51 @@
+"""Tests for the lazily resolved ``episodic.canonical`` package exports."""
+
+import importlib
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+
+from episodic import canonical
+
+
+def test_lazy_export_table_matches_public_api() -> None:
+    """Every public name should have exactly one lazy import location."""
+    assert sorted(canonical._LAZY_EXPORTS) == sorted(canonical.__all__), (
+        "Expected the lazy export table to cover exactly the names in __all__."
+    )
+
+
+@pytest.mark.parametrize("name", sorted(canonical.__all__))
+def test_public_export_resolves_to_defining_module(name: str) -> None:
+    """Each export should resolve to the object its submodule defines."""
+    module = importlib.import_module(canonical._LAZY_EXPORTS[name], canonical.__name__)
+
+    assert getattr(canonical, name) is getattr(module, name), (
+        f"Expected episodic.canonical.{name} to be the submodule's object."
+    )
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    """Names outside the export table should raise ``AttributeError``."""
+    with pytest.raises(AttributeError, match="no_such_export"):
+        _ = canonical.no_such_export  # type: ignore[attr-defined]
+
+
+def test_importing_domain_does_not_load_ingestion_pipeline() -> None:
+    """Importing one submodule should not pull in unrelated exports."""
+    probe = (
+        "import sys\n"
+        "import episodic.canonical.domain\n"
+        "print('episodic.canonical.ingestion_service' in sys.modules)\n"
+    )
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert completed.stdout.strip() == "False", (
+        "Expected the ingestion pipeline to stay unloaded until first access."
+    )
@@ -3,6 +3,7 @@
 import pytest
 from _ingestion_service_helpers import _make_raw_source
 
+from episodic.canonical.adapters import normalizer as normalizer_adapter
 from episodic.canonical.adapters.normalizer import InMemorySourceNormalizer
 from episodic.canonical.tei import parse_tei_header
 
@@ -84,6 +85,29 @@ async def test_normalizer_infers_title_from_content(
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param("\n  \n  Padded title  \nBody", id="blank-leading-lines"),
+        pytest.param("\r\n\tPadded title\r\nBody", id="crlf-line-endings"),
+        pytest.param("Padded title\u2028Body", id="unicode-line-separator"),
+    ],
+)
+async def test_normalizer_infers_title_from_first_non_blank_line(
+    normalizer: InMemorySourceNormalizer,
+    content: str,
+) -> None:
+    """Title inference should honour every ``str.splitlines`` boundary."""
+    raw = _make_raw_source(content=content, metadata={})
+
+    result = await normalizer.normalize(raw)
+
+    assert result.title == "Padded title", (
+        "Expected the first non-blank content line, stripped, as the title."
+    )
+
+
 @pytest.mark.asyncio
 async def test_normalizer_infers_title_from_source_type(
     normalizer: InMemorySourceNormalizer,
@@ -100,3 +124,24 @@ async def test_normalizer_infers_title_from_source_type(
     assert result.title == "Press Release", (
         "Expected title fallback to convert source type into title case."
     )
+
+
+def test_tei_fragment_cache_skips_oversized_titles() -> None:
+    """Only titles within the inferred-title cap should enter the TEI cache."""
+    cached_fragment = normalizer_adapter._cached_tei_xml
+    cached_fragment.cache_clear()
+    short_title = "t" * normalizer_adapter._MAX_TITLE_LENGTH
+    long_title = "t" * (normalizer_adapter._MAX_TITLE_LENGTH + 1)
+
+    first = normalizer_adapter._build_tei_xml(short_title)
+    second = normalizer_adapter._build_tei_xml(short_title)
+    oversized = normalizer_adapter._build_tei_xml(long_title)
+
+    info = cached_fragment.cache_info()
+    assert first == second, "Expected cached fragments to be reused verbatim."
+    assert (info.hits, info.currsize) == (1, 1), (
+        "Expected the short title to hit one entry and the long one to bypass it."
+    )
+    assert oversized == normalizer_adapter._emit_tei_xml(long_title), (
+        "Expected oversized titles to render the same fragment uncached."
+    )
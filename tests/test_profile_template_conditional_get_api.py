@@ -0,0 +1,149 @@
+"""Conditional-GET tests for profile/template REST fetch endpoints."""
+
+import typing as typ
+
+import pytest
+
+from episodic.api.resources import (
+    EpisodeTemplateHistoryResource,
+    SeriesProfileHistoryResource,
+)
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from falcon import testing
+
+    from tests.fixtures.api import CanonicalApiCreators
+
+
+def _entity_path(
+    creators: CanonicalApiCreators,
+    collection: str,
+) -> str:
+    """Create one entity for ``collection`` and return its item path."""
+    profile_id = creators.series_profile(f"api-conditional-{collection}")
+    if collection == "episode-templates":
+        return f"/v1/episode-templates/{creators.episode_template(profile_id)}"
+    return f"/v1/series-profiles/{profile_id}"
+
+
+@pytest.mark.parametrize("collection", ["series-profiles", "episode-templates"])
+def test_get_entity_uses_revision_etag(
+    canonical_api_client: testing.TestClient,
+    canonical_api_creators: CanonicalApiCreators,
+    collection: str,
+) -> None:
+    """Fetch endpoints should tag responses with the entity revision."""
+    path = _entity_path(canonical_api_creators, collection)
+
+    first = canonical_api_client.simulate_get(path)
+    assert first.status_code == 200, f"Expected GET {path} to return HTTP 200."
+    assert first.headers.get("etag") == '"1"', (
+        f"Expected GET {path} to tag the response with revision 1."
+    )
+
+    repeat = canonical_api_client.simulate_get(
+        path,
+        headers={"If-None-Match": '"1"'},
+    )
+    assert repeat.status_code == 304, (
+        f"Expected GET {path} to return HTTP 304 for the current revision."
+    )
+    assert not repeat.content, f"Expected GET {path} 304 response to omit the body."
+
+    stale = canonical_api_client.simulate_get(
+        path,
+        headers={"If-None-Match": '"0"'},
+    )
+    assert stale.status_code == 200, (
+        f"Expected GET {path} to return HTTP 200 for a stale revision tag."
+    )
+
+
+def _update_payload(collection: str) -> dict[str, object]:
+    """Return a PATCH body that records a second history entry."""
+    payload: dict[str, object] = {
+        "expected_revision": 1,
+        "title": "Conditional GET update",
+        "description": "Adds a history entry.",
+    }
+    if collection == "episode-templates":
+        payload["structure"] = {"segments": ["intro", "outro"]}
+    else:
+        payload["configuration"] = {"tone": "updated"}
+    return payload
+
+
+@pytest.mark.parametrize(
+    ("collection", "resource_cls"),
+    [
+        pytest.param(
+            "series-profiles", SeriesProfileHistoryResource, id="series-profiles"
+        ),
+        pytest.param(
+            "episode-templates",
+            EpisodeTemplateHistoryResource,
+            id="episode-templates",
+        ),
+    ],
+)
+def test_get_history_uses_entry_count_etag(
+    canonical_api_client: testing.TestClient,
+    canonical_api_creators: CanonicalApiCreators,
+    monkeypatch: pytest.MonkeyPatch,
+    collection: str,
+    resource_cls: type[SeriesProfileHistoryResource | EpisodeTemplateHistoryResource],
+) -> None:
+    """History endpoints should tag pages with the history entry count."""
+    entity_path = _entity_path(canonical_api_creators, collection)
+    path = f"{entity_path}/history"
+    page_fn = typ.cast(
+        "cabc.Callable[..., cabc.Awaitable[tuple[list[object], int]]]",
+        resource_cls._service_fn,
+    )
+    page_loads: list[object] = []
+
+    async def recording_page_fn(
+        *args: object, **kwargs: object
+    ) -> tuple[list[object], int]:
+        page_loads.append(kwargs["parent_id"])
+        return await page_fn(*args, **kwargs)
+
+    monkeypatch.setattr(resource_cls, "_service_fn", recording_page_fn)
+
+    first = canonical_api_client.simulate_get(path)
+    etag = first.headers.get("etag")
+    assert etag == '"1"', f"Expected GET {path} to tag one history entry."
+
+    repeat = canonical_api_client.simulate_get(
+        path,
+        headers={"If-None-Match": etag},
+    )
+    assert repeat.status_code == 304, (
+        f"Expected GET {path} to return HTTP 304 for a matching If-None-Match."
+    )
+    assert not repeat.content, f"Expected GET {path} 304 response to omit the body."
+    assert len(page_loads) == 1, (
+        f"Expected GET {path} to skip loading the history page on a 304."
+    )
+
+    update = canonical_api_client.simulate_patch(
+        entity_path,
+        json=_update_payload(collection),
+    )
+    assert update.status_code == 200, f"Expected PATCH {entity_path} to succeed."
+
+    stale = canonical_api_client.simulate_get(
+        path,
+        headers={"If-None-Match": etag},
+    )
+    assert stale.status_code == 200, (
+        f"Expected GET {path} to return HTTP 200 once a new entry is recorded."
+    )
+    assert stale.headers.get("etag") == '"2"', (
+        f"Expected GET {path} to tag the page with the new entry count."
+    )
+    assert len(page_loads) == 2, (
+        f"Expected GET {path} to load the history page for a stale tag."
+    )
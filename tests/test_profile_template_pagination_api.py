@@ -62,3 +62,38 @@ def test_list_endpoints_return_pagination_envelopes(
     assert payload["total"] == setup_count, (
         f"Expected {endpoint} pagination envelope to include the total count."
     )
+
+
+@pytest.mark.parametrize("endpoint", ["/v1/series-profiles", "/v1/episode-templates"])
+def test_list_endpoints_honour_if_none_match(
+    canonical_api_client: testing.TestClient,
+    canonical_api_creators: CanonicalApiCreators,
+    endpoint: str,
+) -> None:
+    """List endpoints should answer a matching ETag with 304 and no body."""
+    profile_id = canonical_api_creators.series_profile("api-profile-etag")
+    canonical_api_creators.episode_template(profile_id)
+
+    first = canonical_api_client.simulate_get(endpoint)
+    etag = first.headers.get("etag")
+    assert etag is not None, f"Expected {endpoint} to return an ETag header."
+
+    repeat = canonical_api_client.simulate_get(
+        endpoint,
+        headers={"If-None-Match": etag},
+    )
+    assert repeat.status_code == 304, (
+        f"Expected {endpoint} to return HTTP 304 for a matching If-None-Match."
+    )
+    assert not repeat.content, f"Expected {endpoint} 304 response to omit the body."
+
+    canonical_api_creators.episode_template(
+        canonical_api_creators.series_profile("api-profile-etag-changed")
+    )
+    changed = canonical_api_client.simulate_get(
+        endpoint,
+        headers={"If-None-Match": etag},
+    )
+    assert changed.status_code == 200, (
+        f"Expected {endpoint} to return HTTP 200 once the collection changes."
+    )
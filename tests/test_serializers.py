@@ -3,15 +3,24 @@
 import datetime as dt
 import typing as typ
 import uuid
-
-from episodic.api.serializers import serialize_resolved_binding
+from itertools import starmap
+
+from episodic.api.serializers import (
+    serialize_episode_template,
+    serialize_episode_templates,
+    serialize_resolved_binding,
+    serialize_series_profile,
+    serialize_series_profiles,
+)
 from episodic.canonical.domain import (
+    EpisodeTemplate,
     ReferenceBinding,
     ReferenceBindingTargetKind,
     ReferenceDocument,
     ReferenceDocumentKind,
     ReferenceDocumentLifecycleState,
     ReferenceDocumentRevision,
+    SeriesProfile,
 )
 from episodic.canonical.reference_documents import ResolvedBinding
 
@@ -256,3 +265,69 @@ def test_serialize_resolved_binding_uuid_string_conversion() -> None:
     assert isinstance(result["revision"]["reference_document_id"], str)
     assert isinstance(result["document"]["id"], str)
     assert isinstance(result["document"]["owner_series_profile_id"], str)
+
+
+def test_serialize_series_profiles_matches_single_row_serializer() -> None:
+    """Batch profile serialization should produce one payload per row."""
+    timestamp = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+    profiles = [
+        SeriesProfile(
+            id=uuid.uuid4(),
+            slug=f"profile-{index}",
+            title=f"Profile {index}",
+            description=None,
+            configuration={"tone": "calm"},
+            guardrails={},
+            created_at=timestamp,
+            updated_at=timestamp,
+        )
+        for index in range(2)
+    ]
+    rows = [(profile, index + 1) for index, profile in enumerate(profiles)]
+
+    result = serialize_series_profiles(rows)
+
+    assert result[1] == {
+        "id": str(profiles[1].id),
+        "slug": "profile-1",
+        "title": "Profile 1",
+        "description": None,
+        "configuration": {"tone": "calm"},
+        "guardrails": {},
+        "revision": 2,
+        "created_at": timestamp.isoformat(),
+        "updated_at": timestamp.isoformat(),
+    }, "Expected each row to carry its own revision and string identifiers."
+    assert result[0] == serialize_series_profile(*rows[0]), (
+        "Expected batch serialization to match the single-row serializer."
+    )
+
+
+def test_serialize_episode_templates_matches_single_row_serializer() -> None:
+    """Batch template serialization should match the single-row serializer."""
+    timestamp = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+    profile_id = uuid.uuid4()
+    rows = [
+        (
+            EpisodeTemplate(
+                id=uuid.uuid4(),
+                series_profile_id=profile_id,
+                slug=f"template-{index}",
+                title=f"Template {index}",
+                description=None,
+                structure={"segments": ["intro"]},
+                guardrails={},
+                created_at=timestamp,
+                updated_at=timestamp,
+            ),
+            index + 1,
+        )
+        for index in range(2)
+    ]
+
+    result = serialize_episode_templates(rows)
+
+    assert result == list(starmap(serialize_episode_template, rows)), (
+        "Expected the inline batch payload to stay in step with the single-row "
+        "serializer."
+    )